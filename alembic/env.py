@@ -5,13 +5,18 @@ This file configures Alembic for running database migrations.
 It sets up the connection to the database and imports all models.
 
 Instructions:
-- Import all your models in the 'Import all models' section
+- Import all your models in get_target_metadata()
 - This ensures Alembic can detect schema changes
 - Don't modify other parts unless you know what you're doing
+
+Models are imported lazily, only when a database connection is used
+(upgrade, downgrade, autogenerate). Offline (--sql) runs don't need the
+model metadata and skip the import cost entirely.
 """
 
+import asyncio
 from logging.config import fileConfig
-from sqlalchemy import pool
+from sqlalchemy import MetaData, pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
@@ -19,16 +24,6 @@ from alembic import context
 # Import settings for database URL
 from api.configs.settings import settings
 
-# Import base model - this is the parent of all models
-from api.contrib.models import BaseModel
-
-# IMPORTANT: Import all your models here so Alembic can detect them
-# Add new imports as you create new models
-from api.users.models import UserModel
-from api.example_entity.models import ExampleEntityModel
-# from api.products.models import ProductModel
-# from api.categories.models import CategoryModel
-
 # Alembic Config object
 config = context.config
 
@@ -39,9 +34,38 @@ config.set_main_option('sqlalchemy.url', settings.DB_URL)
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# Target metadata for autogenerate support
-# This is where Alembic gets the schema information
-target_metadata = BaseModel.metadata
+# Options shared by offline and online runs
+# - compare_type / compare_server_default: detect column type and default changes
+# - transaction_per_migration: commit each revision on its own instead of
+#   wrapping a whole upgrade in one long transaction
+# Autogenerate reflects the database with SQLAlchemy 2.x's batched
+# multi-table inspection (Inspector.get_multi_*), used by Alembic >= 1.13;
+# both versions are pinned in pyproject.toml / requirements.txt.
+configure_opts = {
+    'compare_type': True,
+    'compare_server_default': True,
+    'transaction_per_migration': True,
+}
+
+
+def get_target_metadata() -> MetaData:
+    """
+    Import all models and return their metadata
+    
+    Target metadata for autogenerate support - this is where Alembic gets
+    the schema information. Called only when it is actually needed.
+    """
+    # Import base model - this is the parent of all models
+    from api.contrib.models import BaseModel
+    
+    # IMPORTANT: Import all your models here so Alembic can detect them
+    # Add new imports as you create new models
+    from api.users.models import UserModel  # noqa: F401
+    from api.example_entity.models import ExampleEntityModel  # noqa: F401
+    # from api.products.models import ProductModel
+    # from api.categories.models import CategoryModel
+    
+    return BaseModel.metadata
 
 
 def run_migrations_offline() -> None:
@@ -57,11 +81,10 @@ def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
-        target_metadata=target_metadata,
+        target_metadata=None,  # Not needed to emit SQL scripts
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
-        compare_type=True,
-        compare_server_default=True,
+        **configure_opts,
     )
 
     with context.begin_transaction():
@@ -74,9 +97,8 @@ def do_run_migrations(connection: Connection) -> None:
     """
     context.configure(
         connection=connection,
-        target_metadata=target_metadata,
-        compare_type=True,
-        compare_server_default=True,
+        target_metadata=get_target_metadata(),
+        **configure_opts,
     )
 
     with context.begin_transaction():
@@ -105,9 +127,25 @@ def run_migrations_online() -> None:
     
     In this scenario we need to create an Engine and associate a connection
     with the context.
+    
+    If a connection is passed in through config.attributes['connection'],
+    it is reused instead: no engine or event loop is created. This lets test
+    suites and scripts that run migrations repeatedly share their own pool
+    and event loop, e.g.:
+    
+        def run_upgrade(connection, alembic_cfg):
+            alembic_cfg.attributes['connection'] = connection
+            command.upgrade(alembic_cfg, 'head')
+        
+        async with engine.begin() as connection:
+            await connection.run_sync(run_upgrade, alembic_cfg)
     """
-    import asyncio
-    asyncio.run(run_async_migrations())
+    connection = config.attributes.get('connection', None)
+    
+    if connection is not None:
+        do_run_migrations(connection)
+    else:
+        asyncio.run(run_async_migrations())
 
 
 # Determine which mode to run in
@@ -12,6 +12,29 @@ Instructions:
 - This file is for reference only
 - Delete it and create your own migrations based on your models
 - Run: alembic revision --autogenerate -m "Initial migration"
+
+Data migrations:
+Migrations that transform existing rows should never load a whole table
+into memory or rewrite it in one transaction. Read rows in pages and commit
+writes in small batches using the helpers in api.contrib.migration_utils:
+
+    from api.contrib.migration_utils import paginate, batched_commit
+
+    def upgrade() -> None:
+        connection = op.get_bind()
+        entities = sa.table('example_entities', sa.column('pk_id'), sa.column('name'))
+        rows = paginate(connection, sa.select(entities), entities.c.pk_id, page_size=100)
+
+        for batch in batched_commit(op, (row for page in rows for row in page), batch_size=20):
+            connection.execute(
+                entities.update()
+                .where(entities.c.pk_id == sa.bindparam('b_pk_id'))
+                .values(name=sa.bindparam('b_name')),
+                [{'b_pk_id': row.pk_id, 'b_name': row.name.strip()} for row in batch]
+            )
+
+Memory stays bounded by the page size, and each batch is committed on its
+own, so a large table never becomes one huge transaction.
 """
 from typing import Sequence, Union
 
@@ -48,8 +71,8 @@ def upgrade() -> None:
     )
     
     # Create indexes
+    # No separate index on 'id': the UniqueConstraint above already creates one
     op.create_index(op.f('ix_example_entities_name'), 'example_entities', ['name'], unique=False)
-    op.create_index(op.f('ix_example_entities_id'), 'example_entities', ['id'], unique=False)
 
 
 def downgrade() -> None:
@@ -59,7 +82,6 @@ def downgrade() -> None:
     This function is called when you run: alembic downgrade -1
     """
     # Drop indexes
-    op.drop_index(op.f('ix_example_entities_id'), table_name='example_entities')
     op.drop_index(op.f('ix_example_entities_name'), table_name='example_entities')
     
     # Drop table
@@ -0,0 +1,63 @@
+"""Create users table
+
+Revision ID: 002_users
+Revises: 001_example
+Create Date: 2026-10-15
+
+Creates the table backing api.users.models.UserModel.
+
+The username and email columns get unique B-tree indexes. get_current_user
+looks users up by username on every authenticated request, so without
+ix_users_username that lookup would be a sequential scan growing with
+the number of users.
+
+Tables and indexes are only created if missing, so databases that already
+have a users table (e.g. from an earlier autogenerate) are left untouched.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision: str = '002_users'
+down_revision: Union[str, None] = '001_example'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Apply migration - Create users table and its lookup indexes
+    """
+    op.create_table(
+        'users',
+        sa.Column('pk_id', sa.Integer(), autoincrement=True, nullable=False, comment='Primary key'),
+        sa.Column('id', UUID(as_uuid=True), nullable=False),
+        sa.Column('username', sa.String(length=50), nullable=False, comment='Unique username'),
+        sa.Column('email', sa.String(length=100), nullable=False, comment='User email address'),
+        sa.Column('hashed_password', sa.String(length=255), nullable=False, comment='Hashed password'),
+        sa.Column('is_active', sa.Boolean(), nullable=False, comment='Account active status'),
+        sa.Column('is_superuser', sa.Boolean(), nullable=False, comment='Admin privileges'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, comment='Account creation timestamp'),
+        sa.PrimaryKeyConstraint('pk_id'),
+        sa.UniqueConstraint('id'),
+        if_not_exists=True,
+    )
+
+    # Create indexes
+    op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True, if_not_exists=True)
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """
+    Rollback migration - Drop users table
+    """
+    # Drop indexes
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_index(op.f('ix_users_username'), table_name='users')
+
+    # Drop table
+    op.drop_table('users')
@@ -0,0 +1,44 @@
+"""Drop redundant index on example_entities.id
+
+Revision ID: 003_drop_example_id_index
+Revises: 002_users
+Create Date: 2026-10-15
+
+Earlier versions of the initial migration created ix_example_entities_id
+in addition to the unique constraint on example_entities.id. The unique
+constraint already creates a B-tree index on the column, so the second
+index only doubled index maintenance on every INSERT/UPDATE.
+
+Databases created from the current initial migration never had the index;
+it is only dropped if it exists.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003_drop_example_id_index'
+down_revision: Union[str, None] = '002_users'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Apply migration - Drop ix_example_entities_id if present
+    """
+    op.drop_index(
+        op.f('ix_example_entities_id'),
+        table_name='example_entities',
+        if_exists=True
+    )
+
+
+def downgrade() -> None:
+    """
+    Rollback migration - Nothing to restore
+
+    The unique constraint on example_entities.id keeps the column indexed,
+    so the redundant index is not recreated.
+    """
+    pass
@@ -0,0 +1,72 @@
+"""Add list and search indexes to example_entities
+
+Revision ID: 004_example_list_indexes
+Revises: 003_drop_example_id_index
+Create Date: 2026-10-15
+
+The example list endpoint filters on is_active, orders by
+(created_at DESC, pk_id DESC) and pages with a keyset cursor on the same
+columns. Without a matching index PostgreSQL reads the whole table and
+sorts it on every request.
+
+- ix_example_entities_active_created: list filtered by is_active
+- ix_example_entities_created: unfiltered list
+- ix_example_entities_name_trgm: name.ilike('%term%') (GIN + pg_trgm),
+  which a B-tree index cannot serve because of the leading wildcard
+
+On large tables, consider creating the indexes with
+postgresql_concurrently=True inside op.get_context().autocommit_block()
+so writes are not blocked while they build.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004_example_list_indexes'
+down_revision: Union[str, None] = '003_drop_example_id_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Apply migration - Create list and trigram search indexes
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.create_index(
+        'ix_example_entities_active_created',
+        'example_entities',
+        ['is_active', sa.text('created_at DESC'), sa.text('pk_id DESC')],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_example_entities_created',
+        'example_entities',
+        [sa.text('created_at DESC'), sa.text('pk_id DESC')],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_example_entities_name_trgm',
+        'example_entities',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """
+    Rollback migration - Drop list and trigram search indexes
+
+    The pg_trgm extension is left installed, other objects may use it.
+    """
+    op.drop_index('ix_example_entities_name_trgm', table_name='example_entities')
+    op.drop_index('ix_example_entities_created', table_name='example_entities')
+    op.drop_index('ix_example_entities_active_created', table_name='example_entities')
@@ -0,0 +1,45 @@
+"""Add full-text search index to example_entities
+
+Revision ID: 006_example_search_index
+Revises: 005_example_created_at_default
+Create Date: 2026-10-15
+
+GIN index over to_tsvector('simple', name || ' ' || coalesce(description, '')),
+for full-text search across name and description with websearch_to_tsquery.
+The expression must match example_search_vector in
+api/example_entity/models.py exactly, or the planner won't use the index.
+
+Substring filters on name alone (ILIKE '%term%') are served by the trigram
+index from migration 004.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006_example_search_index'
+down_revision: Union[str, None] = '005_example_created_at_default'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Apply migration - Create full-text search index
+    """
+    op.create_index(
+        'ix_example_entities_search',
+        'example_entities',
+        [sa.text("to_tsvector('simple'::regconfig, name || ' ' || coalesce(description, ''))")],
+        unique=False,
+        postgresql_using='gin',
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """
+    Rollback migration - Drop full-text search index
+    """
+    op.drop_index('ix_example_entities_search', table_name='example_entities')
@@ -0,0 +1,60 @@
+"""Add trigram search indexes to users
+
+Revision ID: 007_users_search_indexes
+Revises: 006_example_search_index
+Create Date: 2026-10-15
+
+The admin user list filters with username.ilike('%term%') and
+email.ilike('%term%'). The leading wildcard rules out the unique B-tree
+indexes from migration 002, so every filtered page was a sequential scan.
+GIN indexes with pg_trgm's gin_trgm_ops serve these substring searches.
+
+Usernames are lowercased by the UserCreate schema before they are stored,
+so ix_users_username already enforces case-insensitive uniqueness and no
+separate lower(username) index is needed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007_users_search_indexes'
+down_revision: Union[str, None] = '006_example_search_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Apply migration - Create trigram indexes on username and email
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.create_index(
+        'ix_users_username_trgm',
+        'users',
+        ['username'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'username': 'gin_trgm_ops'},
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_users_email_trgm',
+        'users',
+        ['email'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'email': 'gin_trgm_ops'},
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """
+    Rollback migration - Drop trigram indexes
+
+    The pg_trgm extension is left installed, other objects may use it.
+    """
+    op.drop_index('ix_users_email_trgm', table_name='users')
+    op.drop_index('ix_users_username_trgm', table_name='users')
@@ -0,0 +1,45 @@
+"""Set users.created_at server default
+
+Revision ID: 008_users_created_at_default
+Revises: 007_users_search_indexes
+Create Date: 2026-10-15
+
+created_at is now filled in by the database (UTC transaction time) instead
+of by the application, and returned by the INSERT ... RETURNING statement.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '008_users_created_at_default'
+down_revision: Union[str, None] = '007_users_search_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Apply migration - Add DEFAULT timezone('utc', now()) to created_at
+    """
+    op.alter_column(
+        'users',
+        'created_at',
+        server_default=sa.text("timezone('utc', now())"),
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """
+    Rollback migration - Drop the created_at default
+    """
+    op.alter_column(
+        'users',
+        'created_at',
+        server_default=None,
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+    )
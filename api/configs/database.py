@@ -7,8 +7,29 @@ It provides a session generator for dependency injection in FastAPI routes.
 Instructions:
 1. The database URL is loaded from settings (environment variables)
 2. Use get_session() as a dependency in your route handlers
+   (get_read_session() for read-only queries, see below)
 3. Configure engine parameters based on your needs (pool size, echo, etc.)
 
+Read-only sessions:
+get_read_session() is meant for SELECT-heavy paths (e.g. list endpoints).
+Set DB_READ_URL to route these reads to a replica through a separate engine
+and pool (DB_READ_POOL_SIZE + DB_READ_MAX_OVERFLOW). Without it, read
+sessions share the primary engine and pool, so each worker opens at most
+DB_POOL_SIZE + DB_MAX_OVERFLOW connections. Replicas may lag behind the
+primary, so read-your-own-writes paths should use get_session().
+
+Connection health checks:
+pool_pre_ping is off by default. It issues a SELECT 1 on every pool checkout,
+which doubles the number of database round-trips for short requests. Stale
+connections are instead replaced by pool_recycle (DB_POOL_RECYCLE). Enable
+DB_PRE_PING if your network or database drops idle connections before they
+are recycled (e.g. aggressive firewalls or proxies).
+
+Startup and shutdown:
+The application lifespan (api/main.py) calls warm_up_pools() so the first
+requests don't pay the connect cost, and dispose_engines() to close every
+pooled connection cleanly on shutdown.
+
 Example usage in a route:
     from api.contrib.dependencies import DatabaseDependency
     
@@ -18,33 +39,149 @@ Example usage in a route:
         return result.scalars().all()
 """
 
+import asyncio
+import logging
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from api.configs.settings import settings
 
 
+logger = logging.getLogger(__name__)
+
+
+# asyncpg connection arguments shared by both engines
+# server_settings are applied to every new connection:
+# - jit=off: PostgreSQL's JIT compilation costs more than it saves on the
+#   short OLTP queries an API runs (e.g. the auth lookup)
+# - application_name: identifies connections in pg_stat_activity
+# prepared_statement_cache_size keeps parsed/planned statements per
+# connection, so repeated queries (like the auth lookup) skip PARSE and are
+# sent as a single EXECUTE. Set DB_STATEMENT_CACHE_SIZE=0 behind PgBouncer
+# in transaction pooling mode.
+connect_args = {
+    'server_settings': {
+        'jit': 'off',
+        'application_name': settings.APP_NAME,
+    },
+    'prepared_statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE,
+}
+
 # Create async database engine
-# echo=False: Disable SQL query logging (set to True for debugging)
-# pool_size: Number of connections to maintain in the pool
-# max_overflow: Maximum number of connections that can be created beyond pool_size
+# Connections are kept in a pool and reused across requests, so handlers
+# don't pay the TCP/TLS/asyncpg connect cost every time they open a session.
+# Pool sizing is tunable through settings (DB_POOL_* environment variables).
 engine = create_async_engine(
     settings.DB_URL,
     echo=False,  # Set to True to log all SQL queries
-    # pool_pre_ping=True,  # Verify connections before using them
-    # pool_size=5,  # Number of connections in the pool
-    # max_overflow=10,  # Additional connections beyond pool_size
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,  # Number of connections in the pool
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Additional connections beyond pool_size
+    pool_timeout=settings.DB_POOL_TIMEOUT,  # Seconds to wait for a free connection
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Replace connections older than this
+    pool_pre_ping=settings.DB_PRE_PING,  # SELECT 1 on checkout (off by default)
+    connect_args=connect_args,
 )
 
+# Create read-only async database engine
+# Separate pool only when a replica is configured; otherwise reads reuse the
+# primary engine so the worker's connection budget isn't doubled
+if settings.DB_READ_URL:
+    read_engine = create_async_engine(
+        settings.DB_READ_URL,
+        echo=False,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DB_READ_POOL_SIZE,
+        max_overflow=settings.DB_READ_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_PRE_PING,
+        connect_args=connect_args,
+    )
+else:
+    read_engine = engine
+
 # Create async session factory
-async_session = sessionmaker(
+# expire_on_commit=False keeps objects loaded after commit, so reading them
+# afterwards (e.g. to build the response) doesn't trigger a refresh SELECT
+async_session = async_sessionmaker(
     engine,
-    class_=AsyncSession,
     expire_on_commit=False,  # Don't expire objects after commit
-    autocommit=False,
     autoflush=False,
 )
 
+# Create read-only async session factory
+read_session = async_sessionmaker(
+    read_engine,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+
+async def warm_up_pool(db_engine: AsyncEngine, connections: int) -> None:
+    """
+    Open pool connections ahead of the first request
+    
+    Opens the connections concurrently, runs SELECT 1 on each, then returns
+    them to the pool, where they stay open for reuse. Every connection that
+    did open is returned even if others fail.
+    
+    Args:
+        db_engine: Engine whose pool should be filled
+        connections: Number of connections to open
+        
+    Raises:
+        Exception: The first error raised while connecting
+    """
+    if connections <= 0:
+        return
+    
+    results = await asyncio.gather(
+        *(db_engine.connect().start() for _ in range(connections)),
+        return_exceptions=True
+    )
+    conns = [result for result in results if not isinstance(result, BaseException)]
+    try:
+        for conn in conns:
+            await conn.execute(text('SELECT 1'))
+    finally:
+        for conn in conns:
+            await conn.close()
+    
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+async def warm_up_pools() -> None:
+    """
+    Warm up the read-write and read-only pools (DB_POOL_WARMUP connections each)
+    
+    Warm-up is best effort: failures are logged and startup continues, the
+    pools then connect on demand.
+    """
+    warmups = [warm_up_pool(engine, min(settings.DB_POOL_WARMUP, settings.DB_POOL_SIZE))]
+    if read_engine is not engine:
+        warmups.append(
+            warm_up_pool(read_engine, min(settings.DB_POOL_WARMUP, settings.DB_READ_POOL_SIZE))
+        )
+    results = await asyncio.gather(*warmups, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning('Database pool warm-up failed: %r', result)
+        elif isinstance(result, BaseException):
+            raise result
+
+
+async def dispose_engines() -> None:
+    """
+    Close all pooled connections of both engines
+    """
+    await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -64,3 +201,23 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     async with async_session() as session:
         yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async generator that provides read-only database sessions
+    
+    Same as get_session(), but backed by the read pool (DB_READ_URL).
+    Use it for routes that only run SELECT queries.
+    
+    Yields:
+        AsyncSession: SQLAlchemy async session bound to the read engine
+        
+    Example:
+        @router.get('/items')
+        async def get_items(db: ReadDatabaseDependency):
+            result = await db.execute(select(Item))
+            return result.scalars().all()
+    """
+    async with read_session() as session:
+        yield session
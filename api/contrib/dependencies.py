@@ -6,19 +6,31 @@ Dependencies are reusable components that can be injected into route handlers.
 
 Instructions:
 1. Use DatabaseDependency in your routes to get a database session
+   (ReadDatabaseDependency for read-only routes)
 2. Use CurrentUser to get the authenticated user (JWT Bearer token)
-3. Use CurrentUserBasic to get the authenticated user (HTTP Basic Auth)
-4. Use RequireAdmin to ensure user has admin privileges (JWT)
-5. Use RequireAdminBasic for admin with Basic Auth
+3. Use CurrentUserModel when you need the full UserModel (e.g. to modify it)
+4. Use CurrentUserBasic to get the authenticated user (HTTP Basic Auth)
+5. Use RequireAdmin to ensure user has admin privileges (JWT)
+6. Use RequireAdminBasic for admin with Basic Auth
+7. Declare the auth dependency before the database session in route
+   signatures: dependencies resolve in order, so requests without
+   credentials are rejected before a session is opened
 """
 
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Annotated
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from uuid import UUID
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPBearer
+from sqlalchemy import bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import defer
 
-from api.configs.database import get_session
+from api.configs.database import get_read_session, get_session
+from api.configs.settings import settings
 from api.users.models import UserModel
 from api.users.auth import decode_access_token
 
@@ -26,23 +38,139 @@ from api.users.auth import decode_access_token
 # Type alias for database session dependency
 DatabaseDependency = Annotated[AsyncSession, Depends(get_session)]
 
+# Type alias for read-only database session dependency
+ReadDatabaseDependency = Annotated[AsyncSession, Depends(get_read_session)]
+
+
+class BearerToken(HTTPBearer):
+    """
+    HTTP Bearer security scheme that returns the raw token string
+    
+    Behaves like HTTPBearer (and still shows up in the OpenAPI docs with the
+    "Authorize" button), but reads the Authorization header directly instead
+    of building an HTTPAuthorizationCredentials model on every request.
+    """
+    
+    async def __call__(self, request: Request) -> str:
+        authorization = request.headers.get('Authorization')
+        
+        if not authorization or authorization[:7].lower() != 'bearer ':
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail='Not authenticated',
+                headers={'WWW-Authenticate': 'Bearer'}
+            )
+        
+        return authorization[7:]
+
+
 # HTTP Bearer token security (JWT)
-security = HTTPBearer()
+security = BearerToken(scheme_name='HTTPBearer')
+
+
+@dataclass(frozen=True, slots=True)
+class AuthUser:
+    """
+    Lightweight authenticated user returned by get_current_user
+    
+    Holds the user's public fields (everything in UserOut), so the auth
+    lookup doesn't have to load and track a full UserModel instance and
+    read-only routes like GET /auth/me can be served from the cache.
+    Use CurrentUserModel when a route needs the ORM instance.
+    
+    Attributes:
+        id: User UUID
+        username: Username
+        email: User email address
+        is_active: Whether user account is active
+        is_superuser: Whether user has admin privileges
+        created_at: Account creation timestamp
+    """
+    
+    id: UUID
+    username: str
+    email: str
+    is_active: bool
+    is_superuser: bool
+    created_at: datetime
+
+
+# Short-lived cache of authenticated users, keyed by username
+# Back-to-back requests from the same user skip the database lookup entirely.
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=max(settings.AUTH_USER_CACHE_TTL, 1))
+
+# Auth lookup statement, built once and reused with a bound username
+# Selects only the columns needed for AuthUser (in field order)
+_AUTH_USER_BY_USERNAME = select(
+    UserModel.id,
+    UserModel.username,
+    UserModel.email,
+    UserModel.is_active,
+    UserModel.is_superuser,
+    UserModel.created_at,
+).where(UserModel.username == bindparam('username'))
+
+# Full user lookup for CurrentUserModel, also built once with a bound id
+# hashed_password is deferred: no route reads it from here, and it is the
+# largest column. Assigning a new hash still works without loading it.
+_USER_BY_ID = (
+    select(UserModel)
+    .where(UserModel.id == bindparam('user_id'))
+    .options(defer(UserModel.hashed_password))
+)
+
+
+def invalidate_cached_user(username: str) -> None:
+    """
+    Drop a user from the authentication cache
+    
+    Call this after changing a user's status, permissions or deleting it,
+    so the next request reloads the user from the database.
+    
+    Args:
+        username: Username of the user to evict
+    """
+    _user_cache.pop(username, None)
+
+
+async def _load_auth_user(db_session: AsyncSession, username: str) -> AuthUser | None:
+    """
+    Load the auth fields of a user by username, using the cache when possible
+    
+    Cache misses are loaded from the primary: writes evict the user from the
+    cache, and reloading from a lagging replica would re-cache the old row.
+    """
+    user = _user_cache.get(username)
+    if user is not None:
+        return user
+    
+    result = await db_session.execute(_AUTH_USER_BY_USERNAME, {'username': username})
+    row = result.one_or_none()
+    if row is None:
+        return None
+    
+    user = AuthUser(*row)
+    if settings.AUTH_USER_CACHE_TTL > 0:
+        _user_cache[username] = user
+    
+    return user
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    token: str = Depends(security),
     db_session: AsyncSession = Depends(get_session)
-) -> UserModel:
+) -> AuthUser:
     """
     Validate JWT token and return current user
     
+    The session only checks out a connection on a cache miss.
+    
     Args:
-        credentials: HTTP authorization credentials
-        db_session: Database session
+        token: JWT token from the Authorization header
+        db_session: Database session (primary, see _load_auth_user)
         
     Returns:
-        UserModel: Current authenticated user
+        AuthUser: Current authenticated user (id, username and flags)
         
     Raises:
         HTTPException: If token is invalid or user not found
@@ -52,8 +180,6 @@ async def get_current_user(
         async def protected_route(current_user: CurrentUser):
             return {"user": current_user.username}
     """
-    token = credentials.credentials
-    
     # Decode token
     username = decode_access_token(token)
     if username is None:
@@ -63,11 +189,8 @@ async def get_current_user(
             headers={'WWW-Authenticate': 'Bearer'}
         )
     
-    # Get user from database
-    result = await db_session.execute(
-        select(UserModel).filter_by(username=username)
-    )
-    user = result.scalars().first()
+    # Get user from cache or database
+    user = await _load_auth_user(db_session, username)
     
     if user is None:
         raise HTTPException(
@@ -86,10 +209,61 @@ async def get_current_user(
 
 
 # Type alias for current user dependency
-CurrentUser = Annotated[UserModel, Depends(get_current_user)]
+CurrentUser = Annotated[AuthUser, Depends(get_current_user)]
+
+
+async def get_current_user_model(
+    current_user: CurrentUser,
+    db_session: AsyncSession = Depends(get_session)
+) -> UserModel:
+    """
+    Return the full UserModel for the authenticated user
+    
+    Use this only in routes that need the ORM instance, e.g. to modify the
+    user. The instance is attached to the request's database session.
+    hashed_password is not loaded (it can still be assigned); if a route
+    must read it, load it first with
+    await db_session.refresh(user, ['hashed_password']).
+    
+    Args:
+        current_user: Current authenticated user
+        db_session: Database session
+        
+    Returns:
+        UserModel: Current authenticated user
+        
+    Raises:
+        HTTPException: If the user no longer exists
+        
+    Usage:
+        @router.patch('/me')
+        async def update_me(user: CurrentUserModel, db_session: DatabaseDependency):
+            user.email = 'new@example.com'
+            await db_session.commit()
+    """
+    # If you add relationships to UserModel that routes read after this
+    # dependency (e.g. roles), eager-load them here in one extra query
+    # instead of one lazy load per relationship:
+    # from sqlalchemy.orm import selectinload
+    # _USER_BY_ID.options(selectinload(UserModel.roles))
+    result = await db_session.execute(_USER_BY_ID, {'user_id': current_user.id})
+    user = result.scalar_one_or_none()
+    
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail='User not found',
+            headers={'WWW-Authenticate': 'Bearer'}
+        )
+    
+    return user
+
+
+# Type alias for full ORM current user dependency
+CurrentUserModel = Annotated[UserModel, Depends(get_current_user_model)]
 
 
-async def require_admin(current_user: CurrentUser) -> UserModel:
+async def require_admin(current_user: CurrentUser) -> AuthUser:
     """
     Ensure current user has admin permissions
     
@@ -97,14 +271,14 @@ async def require_admin(current_user: CurrentUser) -> UserModel:
         current_user: Current authenticated user
         
     Returns:
-        UserModel: Current user (if admin)
+        AuthUser: Current user (if admin)
         
     Raises:
         HTTPException: If user is not an admin
         
     Usage:
         @router.delete('/admin/users/{id}')
-        async def delete_user(admin: RequireAdmin, user_id: UUID4):
+        async def delete_user(admin: RequireAdmin, user_id: UUID):
             # Only admins can access this endpoint
             pass
     """
@@ -117,7 +291,7 @@ async def require_admin(current_user: CurrentUser) -> UserModel:
 
 
 # Type alias for admin user dependency
-RequireAdmin = Annotated[UserModel, Depends(require_admin)]
+RequireAdmin = Annotated[AuthUser, Depends(require_admin)]
 
 
 # Import Basic Auth dependencies
@@ -0,0 +1,114 @@
+"""
+Migration Utilities
+
+Helpers for writing Alembic data migrations that touch many rows.
+
+Loading a whole table into memory and rewriting it in a single transaction
+works on a development database but falls over on real data: memory grows
+with the table, and one huge transaction holds locks and bloats the WAL
+until it finishes. These helpers read rows in fixed-size pages and commit
+writes in small batches instead, so memory stays bounded and progress is
+kept if the migration is interrupted.
+
+Instructions:
+1. Use paginate() to read rows page by page (keyset pagination on a key column)
+2. Use batched_commit() to write each batch in its own transaction
+3. Issue one executemany statement per batch instead of one statement per row
+
+Example (inside a migration's upgrade()):
+    from alembic import op
+    import sqlalchemy as sa
+    from api.contrib.migration_utils import paginate, batched_commit
+
+    entities = sa.table('example_entities', sa.column('pk_id'), sa.column('name'))
+
+    def upgrade() -> None:
+        connection = op.get_bind()
+        rows = paginate(connection, sa.select(entities), entities.c.pk_id, page_size=100)
+
+        for batch in batched_commit(op, (row for page in rows for row in page), batch_size=20):
+            connection.execute(
+                entities.update()
+                .where(entities.c.pk_id == sa.bindparam('b_pk_id'))
+                .values(name=sa.bindparam('b_name')),
+                [{'b_pk_id': row.pk_id, 'b_name': row.name.strip()} for row in batch]
+            )
+"""
+
+from itertools import islice
+from typing import Any, Iterable, Iterator, Sequence
+
+from sqlalchemy import Column, Row, Select
+from sqlalchemy.engine import Connection
+
+
+def paginate(
+    connection: Connection,
+    stmt: Select,
+    key_column: Column,
+    page_size: int = 100,
+) -> Iterator[Sequence[Row]]:
+    """
+    Yield the rows of a SELECT statement in pages
+
+    Uses keyset pagination (WHERE key > last_key ORDER BY key LIMIT n), so
+    each page is an index range scan and the cost does not grow with how
+    far into the table the migration has progressed.
+
+    Args:
+        connection: Connection from op.get_bind()
+        stmt: SELECT statement to page through (must include key_column)
+        key_column: Unique, indexed column to page on (e.g. the primary key)
+        page_size: Number of rows per page
+
+    Yields:
+        Sequence[Row]: One page of rows
+
+    Example:
+        for page in paginate(connection, sa.select(table), table.c.pk_id):
+            ...
+    """
+    last_key = None
+
+    while True:
+        page_stmt = stmt.order_by(key_column).limit(page_size)
+        if last_key is not None:
+            page_stmt = page_stmt.where(key_column > last_key)
+
+        rows = connection.execute(page_stmt).all()
+        if not rows:
+            return
+
+        yield rows
+
+        if len(rows) < page_size:
+            return
+        last_key = rows[-1]._mapping[key_column]
+
+
+def batched_commit(
+    op: Any,
+    items: Iterable[Any],
+    batch_size: int = 20,
+) -> Iterator[list[Any]]:
+    """
+    Yield items in batches, each written in its own committed transaction
+
+    Runs inside Alembic's autocommit_block(), so the migration's outer
+    transaction is committed first and every statement executed for a
+    batch is committed as soon as it runs. Execute one statement per batch
+    (an executemany with a list of parameter dicts).
+
+    Args:
+        op: The alembic.op module
+        items: Rows or values to process
+        batch_size: Number of items per batch
+
+    Yields:
+        list: One batch of items
+    """
+    iterator = iter(items)
+
+    with op.get_context().autocommit_block():
+        while batch := list(islice(iterator, batch_size)):
+            yield batch
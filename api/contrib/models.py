@@ -19,8 +19,8 @@ Example:
         name: Mapped[str] = mapped_column(String(100), nullable=False)
 """
 
-from uuid import uuid4
 from sqlalchemy import UUID
+from uuid_utils.compat import uuid7
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
@@ -30,7 +30,7 @@ class BaseModel(DeclarativeBase):
     Base model for all database entities
     
     Provides:
-    - id: UUID field for unique identification
+    - id: UUID field for unique identification (time-ordered UUIDv7)
     - DeclarativeBase: SQLAlchemy ORM base class
     
     All entity models should inherit from this class.
@@ -44,12 +44,14 @@ class BaseModel(DeclarativeBase):
     """
     
     # UUID field - unique identifier for each record
+    # UUIDv7 values start with a timestamp, so new rows are appended to the
+    # right edge of the index instead of landing on random pages (uuid4).
+    # unique=True already creates an index, so no separate index=True
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
-        default=uuid4,
+        default=uuid7,
         nullable=False,
         unique=True,
-        index=True,
     )
     
     # Optional: Add common timestamp fields
@@ -0,0 +1,136 @@
+"""
+Keyset Pagination Helpers
+
+Helpers for cursor-based (keyset) pagination in newest-first order.
+
+Instead of OFFSET, which makes the database read and discard every row
+before the requested page, keyset pagination remembers where the previous
+page ended and continues from there:
+
+    WHERE (created_at, pk_id) < (:last_created_at, :last_pk_id)
+    ORDER BY created_at DESC, pk_id DESC
+    LIMIT :size + 1
+
+Every page is an index range scan, so page 1000 costs the same as page 1,
+and no COUNT(*) query is needed. pk_id breaks ties between rows created in
+the same instant.
+
+Instructions:
+1. Accept CursorPaginationParams (api.contrib.schemas) in your route
+2. Apply apply_keyset() to your filtered query
+3. Return cursor_page(rows, size) with response_model=CursorPage[YourOut]
+
+Example:
+    from api.contrib.pagination import apply_keyset, cursor_page
+
+    query = apply_keyset(select(ItemModel), ItemModel, pagination.cursor, pagination.size)
+    result = await db_session.execute(query)
+    return cursor_page(result.scalars().all(), pagination.size)
+"""
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+
+
+# Upper bound for cursors sent by clients (encode_cursor() output stays
+# below it even for BIGINT ids); longer strings are rejected before decoding
+_MAX_CURSOR_LENGTH = 64
+
+# pk_id must fit the INTEGER primary key columns it is compared with,
+# otherwise the database rejects the query. Raise to 2**63 - 1 if your
+# models use BigInteger primary keys.
+_MAX_PK_ID = 2**31 - 1
+
+
+def encode_cursor(created_at: datetime, pk_id: int) -> str:
+    """
+    Encode the position of the last item of a page into an opaque cursor
+
+    Args:
+        created_at: Creation timestamp of the last item returned
+        pk_id: Primary key of the last item returned
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    return urlsafe_b64encode(f'{created_at.isoformat()}|{pk_id}'.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a cursor created by encode_cursor()
+
+    Args:
+        cursor: Cursor string sent by the client
+
+    Returns:
+        tuple: (created_at, pk_id) of the item to continue after
+
+    Raises:
+        HTTPException 400: If the cursor is malformed
+    """
+    try:
+        if len(cursor) > _MAX_CURSOR_LENGTH:
+            raise ValueError('Cursor is too long')
+        created_at, pk_id = urlsafe_b64decode(cursor.encode()).decode().split('|')
+        created_at = datetime.fromisoformat(created_at)
+        # encode_cursor() only produces naive (UTC) timestamps, matching the
+        # TIMESTAMP WITHOUT TIME ZONE columns; an offset can't be compared
+        if created_at.tzinfo is not None:
+            raise ValueError('Cursor timestamp must not have a UTC offset')
+        pk_id = int(pk_id)
+        if not 0 <= pk_id <= _MAX_PK_ID:
+            raise ValueError('Cursor id is out of range')
+        return created_at, pk_id
+    except (Base64Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Invalid pagination cursor'
+        )
+
+
+def apply_keyset(stmt: Select, model: type, cursor: Optional[str], size: int) -> Select:
+    """
+    Restrict a query to one keyset page, newest first
+
+    Fetches one extra row so cursor_page() can tell whether a next page exists.
+
+    Args:
+        stmt: Base SELECT statement (filters already applied, no ORDER BY)
+        model: Model class with created_at and pk_id columns
+        cursor: Cursor from the previous page, or None for the first page
+        size: Number of items per page
+
+    Returns:
+        Select: Statement returning at most size + 1 rows after the cursor
+    """
+    if cursor:
+        stmt = stmt.where(tuple_(model.created_at, model.pk_id) < decode_cursor(cursor))
+
+    return stmt.order_by(model.created_at.desc(), model.pk_id.desc()).limit(size + 1)
+
+
+def cursor_page(rows: Sequence[Any], size: int) -> dict:
+    """
+    Build a cursor page from rows fetched with apply_keyset()
+
+    Args:
+        rows: Rows returned by the keyset query (up to size + 1)
+        size: Number of items per page
+
+    Returns:
+        dict: {'items': [...], 'next_cursor': str | None}, matching CursorPage
+    """
+    items = list(rows[:size])
+    next_cursor = None
+
+    if len(rows) > size:
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.pk_id)
+
+    return {'items': items, 'next_cursor': next_cursor}
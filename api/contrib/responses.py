@@ -0,0 +1,78 @@
+"""
+JSON Response Classes
+
+Response classes that serialize known schema shapes directly to JSON bytes.
+
+When an endpoint returns a plain object, FastAPI validates it against
+response_model, runs jsonable_encoder over it and then dumps the result.
+For schemas we already trust, that is redundant work on every request.
+Returning one of these responses skips all of it: FastAPI sends a Response
+instance as-is, and the content is encoded in a single pass.
+
+Instructions:
+1. Keep response_model=<Out schema> on the route (used for the OpenAPI docs)
+2. Return MsgspecJSONResponse(struct) for msgspec Structs
+3. Return PydanticJSONResponse(model) for Pydantic models
+4. Pass status_code= for anything other than 200
+
+Example:
+    from api.contrib.responses import MsgspecJSONResponse, PydanticJSONResponse
+
+    @router.get('/{item_id}', response_model=ItemOut)
+    async def get_item(...):
+        return MsgspecJSONResponse(ItemOutFast.from_model(item))
+
+    @router.post('/', response_model=ItemOut, status_code=201)
+    async def create_item(...):
+        return PydanticJSONResponse(ItemOut.from_trusted(item), status_code=201)
+"""
+
+from typing import Any
+
+import msgspec
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+# Encoders keep internal state (buffers, type info) between calls,
+# so build one at import time and reuse it for every response
+_msgspec_encoder = msgspec.json.Encoder()
+
+
+def encode_msgspec_json(content: Any) -> bytes:
+    """
+    Encode msgspec Structs (and plain dicts/lists of them) to JSON bytes
+    
+    Uses the shared module-level encoder. Useful when the encoded body is
+    needed itself, e.g. to cache it or compute an ETag.
+    
+    Args:
+        content: Value to encode
+        
+    Returns:
+        bytes: JSON document
+    """
+    return _msgspec_encoder.encode(content)
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """
+    JSON response for msgspec Structs (and plain dicts/lists of them)
+    
+    Uses a module-level msgspec encoder shared by all responses.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return encode_msgspec_json(content)
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response for Pydantic models
+    
+    Uses the model's compiled Rust serializer (same output as
+    model_dump_json()) and skips jsonable_encoder.
+    """
+    
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
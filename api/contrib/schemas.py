@@ -31,8 +31,9 @@ Example:
         email: Optional[str] = None
 """
 
-from typing import Annotated
-from pydantic import UUID4, BaseModel as PydanticBaseModel, Field, ConfigDict
+from typing import Annotated, Any, Generic, Optional, Self, TypeVar
+from uuid import UUID
+from pydantic import BaseModel as PydanticBaseModel, Field, ConfigDict
 from datetime import datetime
 
 
@@ -43,6 +44,8 @@ class BaseSchema(PydanticBaseModel):
     Configuration:
     - extra='forbid': Reject any extra fields not defined in the schema
     - from_attributes=True: Allow creating schemas from ORM models (formerly orm_mode)
+    - frozen=True: Instances are immutable values (use model_copy(update=...) to change)
+    - ser_json_*: Plain JSON-friendly output for model_dump_json() / model_dump(mode='json')
     
     All entity schemas should inherit from this class.
     
@@ -57,8 +60,34 @@ class BaseSchema(PydanticBaseModel):
         extra='forbid',  # Reject extra fields
         from_attributes=True,  # Enable ORM mode (convert from SQLAlchemy models)
         str_strip_whitespace=True,  # Strip whitespace from strings
-        validate_assignment=True,  # Validate on attribute assignment
+        # validate_assignment is left off: values are validated on construction,
+        # re-running validators on every attribute set is pure overhead
+        validate_assignment=False,
+        frozen=True,  # Schemas are never mutated after validation
+        ser_json_timedelta='float',  # Serialize timedeltas as seconds
+        ser_json_bytes='utf8',  # Serialize bytes as UTF-8 strings
     )
+    
+    @classmethod
+    def from_trusted(cls, obj: Any) -> Self:
+        """
+        Build a schema from trusted data without running validation
+        
+        Use this for objects that are already valid, like rows loaded from
+        the database, instead of model_validate(). Values are copied as-is,
+        so never pass user input here.
+        
+        Args:
+            obj: Object with an attribute for every schema field (e.g. an ORM model)
+            
+        Returns:
+            Schema instance built with model_construct()
+            
+        Example:
+            entity = await db_session.get(ProductModel, pk_id)
+            return ProductOut.from_trusted(entity)
+        """
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
 
 
 class OutMixin(BaseSchema):
@@ -66,7 +95,7 @@ class OutMixin(BaseSchema):
     Mixin for output schemas that includes common response fields
     
     Fields:
-    - id: UUID identifier (automatically generated)
+    - id: UUID identifier (automatically generated, UUIDv7)
     - created_at: Timestamp of creation
     
     Use this mixin with your output schemas to include these fields.
@@ -78,7 +107,11 @@ class OutMixin(BaseSchema):
         # This will include: name, price, description, id, created_at
     """
     
-    id: Annotated[UUID4, Field(description='Unique identifier')]
+    # Out schemas are built once from trusted data and only serialized,
+    # so instances passed in as field values are never re-validated
+    model_config = ConfigDict(revalidate_instances='never')
+    
+    id: Annotated[UUID, Field(description='Unique identifier')]
     created_at: Annotated[datetime, Field(description='Creation timestamp')]
     
     # Optional: Add more common output fields
@@ -87,9 +120,12 @@ class OutMixin(BaseSchema):
 
 class PaginationParams(BaseSchema):
     """
-    Schema for pagination parameters
+    Schema for page-number pagination parameters
     
-    Use this for routes that support pagination.
+    Page numbers translate to OFFSET queries, which get slower the deeper the
+    page since the database reads and discards every skipped row. Only use
+    this for small tables; prefer CursorPaginationParams (keyset pagination)
+    for anything that grows. Planned for deprecation.
     
     Example:
         @router.get('/')
@@ -105,6 +141,51 @@ class PaginationParams(BaseSchema):
     size: Annotated[int, Field(default=50, ge=1, le=100, description='Items per page')]
 
 
+class CursorPaginationParams(BaseSchema):
+    """
+    Schema for cursor (keyset) pagination parameters
+    
+    The cursor is an opaque token pointing after the last item of the
+    previous page. Each page is an index range scan, so it costs the same
+    no matter how deep the client pages. Use with
+    api.contrib.pagination.apply_keyset().
+    
+    Example:
+        @router.get('/')
+        async def get_items(
+            db: DatabaseDependency,
+            pagination: CursorPaginationParams = Depends()
+        ):
+            query = apply_keyset(select(ItemModel), ItemModel, pagination.cursor, pagination.size)
+            result = await db.execute(query)
+            return cursor_page(result.scalars().all(), pagination.size)
+    """
+    
+    cursor: Annotated[Optional[str], Field(default=None, description='Cursor returned by the previous page')]
+    size: Annotated[int, Field(default=50, ge=1, le=100, description='Items per page')]
+
+
+ItemT = TypeVar('ItemT')
+
+
+class CursorPage(BaseSchema, Generic[ItemT]):
+    """
+    Response schema for cursor (keyset) paginated lists
+    
+    Fields:
+    - items: Items of the current page
+    - next_cursor: Cursor for the next page (None on the last page)
+    
+    Example:
+        @router.get('/', response_model=CursorPage[ProductOut])
+        async def get_products(...):
+            return cursor_page(rows, pagination.size)
+    """
+    
+    items: Annotated[list[ItemT], Field(description='Items of the current page')]
+    next_cursor: Annotated[Optional[str], Field(None, description='Cursor for the next page, null on the last page')]
+
+
 class MessageResponse(BaseSchema):
     """
     Generic message response schema
@@ -31,25 +31,50 @@ Error Handling:
 - Use HTTPException for expected errors
 - Catch IntegrityError for database constraint violations
 - Log unexpected errors
+
+Responses:
+- Request bodies are validated with the Pydantic schemas (schemas.py)
+- Responses are built from database rows, which are already valid, as
+  msgspec Structs (schemas_fast.py) and returned as MsgspecJSONResponse
+- Endpoints return a Response directly. FastAPI then skips validating and
+  re-serializing the result against response_model, which is kept on the
+  decorator for the OpenAPI docs
+
+Caching:
+- Serialized list pages are cached in-process for LIST_CACHE_TTL seconds
+  and cleared by every write through this router. With several workers,
+  other workers' copies are only dropped by the TTL, so keep it short.
+- List responses carry an ETag; clients sending it back in If-None-Match
+  get 304 Not Modified while the page is unchanged
 """
 
-from datetime import datetime
-from uuid import uuid4
-from typing import Optional
+from hashlib import blake2b
+from uuid import UUID
+from typing import Annotated, AsyncIterator, Optional
 
-from fastapi import APIRouter, Body, HTTPException, Query, status
-from pydantic import UUID4
+from cachetools import TTLCache
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import bindparam, delete, insert, update
 from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
-from fastapi_pagination import Page, paginate
 
-from api.contrib.dependencies import DatabaseDependency, CurrentUserBasic
+from api.contrib.dependencies import (
+    DatabaseDependency,
+    ReadDatabaseDependency,
+    CurrentUserBasic
+)
+from api.contrib.pagination import apply_keyset, cursor_page
+from api.contrib.responses import MsgspecJSONResponse, encode_msgspec_json
+from api.contrib.schemas import CursorPage, CursorPaginationParams
+from api.configs.settings import settings
 from .schemas import (
     ExampleEntityIn,
     ExampleEntityOut,
     ExampleEntityUpdate,
     ExampleEntityList
 )
+from .schemas_fast import ExampleEntityOutFast, ExampleEntityPageFast
 from .models import ExampleEntityModel
 
 
@@ -58,6 +83,40 @@ from .models import ExampleEntityModel
 router = APIRouter()
 
 
+# Serialized list pages: (name, is_active, cursor, size) -> (body, etag)
+# A TTL of 0 disables caching (pages are still served with an ETag)
+_list_cache: TTLCache = TTLCache(maxsize=1024, ttl=max(settings.LIST_CACHE_TTL, 0.1))
+_LIST_CACHE_CONTROL = f'public, max-age={int(settings.LIST_CACHE_TTL)}'
+
+
+# By-id statements, built once and reused with a bound entity_id
+# The SQL text is identical on every call, so SQLAlchemy's compiled cache and
+# asyncpg's prepared statement cache are always hit. The session holds no
+# objects to synchronize, so DML skips synchronize_session work.
+_SELECT_BY_ID = select(ExampleEntityModel).where(ExampleEntityModel.id == bindparam('entity_id'))
+_UPDATE_BY_ID = (
+    update(ExampleEntityModel)
+    .where(ExampleEntityModel.id == bindparam('entity_id'))
+    .returning(ExampleEntityModel)
+    .execution_options(synchronize_session=False)
+)
+_DELETE_BY_ID = (
+    delete(ExampleEntityModel)
+    .where(ExampleEntityModel.id == bindparam('entity_id'))
+    .execution_options(synchronize_session=False)
+)
+
+
+def _list_page_response(request: Request, body: bytes, etag: str) -> Response:
+    """Send a serialized list page, or 304 if the client already has it"""
+    headers = {'ETag': etag, 'Cache-Control': _LIST_CACHE_CONTROL}
+    
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=body, media_type='application/json', headers=headers)
+
+
 # Note: This template uses Basic Auth for simplicity.
 # You can also use JWT auth by importing CurrentUser instead:
 # from api.contrib.dependencies import CurrentUser
@@ -72,8 +131,8 @@ router = APIRouter()
     response_model=ExampleEntityOut
 )
 async def create_entity(
-    db_session: DatabaseDependency,
     current_user: CurrentUserBasic,  # Requires HTTP Basic Authentication
+    db_session: DatabaseDependency,
     entity_in: ExampleEntityIn = Body(
         ...,
         description='Entity data to create'
@@ -85,8 +144,8 @@ async def create_entity(
     Requires HTTP Basic Authentication.
     
     Args:
-        db_session: Database session (injected)
         current_user: Current authenticated user (injected)
+        db_session: Database session (injected)
         entity_in: Input data for the new entity
         
     Returns:
@@ -103,26 +162,24 @@ async def create_entity(
           -d '{"name": "Example Item", "value": 99.99, "is_active": true}'
     """
     try:
-        # Create output schema with UUID and timestamp
-        entity_out = ExampleEntityOut(
-            id=uuid4(),
-            created_at=datetime.utcnow(),
-            **entity_in.model_dump()
-        )
-        
-        # Create database model from output schema
-        entity_model = ExampleEntityModel(**entity_out.model_dump())
+        # Create database model
+        # id (UUIDv7) and created_at are filled in by the column defaults,
+        # created_at by the database in the same INSERT ... RETURNING
+        entity_model = ExampleEntityModel(**entity_in.model_dump())
         
         # Add to database session
         db_session.add(entity_model)
         
         # Commit transaction
         await db_session.commit()
+        _list_cache.clear()
         
-        # Refresh to get any database-generated values
-        # await db_session.refresh(entity_model)
-        
-        return entity_out
+        # No refresh needed: the session doesn't expire objects on commit,
+        # and created_at was already returned by the INSERT
+        return MsgspecJSONResponse(
+            ExampleEntityOutFast.from_model(entity_model),
+            status_code=status.HTTP_201_CREATED
+        )
         
     except IntegrityError as e:
         await db_session.rollback()
@@ -138,15 +195,85 @@ async def create_entity(
         )
 
 
+@router.post(
+    '/bulk',
+    summary='Create multiple example entities',
+    description='Creates several example entities in a single statement (requires authentication)',
+    status_code=status.HTTP_201_CREATED,
+    response_model=list[ExampleEntityOut]
+)
+async def bulk_create_entities(
+    current_user: CurrentUserBasic,  # Requires HTTP Basic Authentication
+    db_session: DatabaseDependency,
+    entities_in: list[ExampleEntityIn] = Body(
+        ...,
+        description='Entities to create',
+        min_length=1,
+        max_length=1000
+    )
+):
+    """
+    Create multiple example entities at once
+    
+    All rows are written with one INSERT ... RETURNING statement, so creating
+    N entities costs one round-trip instead of N. id and created_at are
+    filled in by the column defaults (created_at by the database).
+    
+    Args:
+        current_user: Current authenticated user (injected)
+        db_session: Database session (injected)
+        entities_in: Input data for the new entities (1 to 1000 items)
+        
+    Returns:
+        list[ExampleEntityOut]: Created entities, in request order
+        
+    Raises:
+        HTTPException 401: If authentication fails
+        HTTPException 409: If an entity violates a constraint (nothing is created)
+        HTTPException 500: If database error occurs
+        
+    Example with curl:
+        curl -u username:password -X POST http://localhost:8000/examples/bulk \
+          -H "Content-Type: application/json" \
+          -d '[{"name": "First"}, {"name": "Second", "value": 1.5}]'
+    """
+    try:
+        result = await db_session.scalars(
+            insert(ExampleEntityModel).returning(ExampleEntityModel, sort_by_parameter_order=True),
+            [entity_in.model_dump() for entity_in in entities_in]
+        )
+        entities_out = [ExampleEntityOutFast.from_model(entity) for entity in result.all()]
+        
+        await db_session.commit()
+        _list_cache.clear()
+        
+        return MsgspecJSONResponse(entities_out, status_code=status.HTTP_201_CREATED)
+        
+    except IntegrityError as e:
+        await db_session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f'Entity already exists or constraint violation: {str(e)}'
+        )
+    except Exception as e:
+        await db_session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f'An error occurred while creating the entities: {str(e)}'
+        )
+
+
 @router.get(
     '/',
     summary='List all example entities',
-    description='Retrieves a paginated list of all example entities with optional filtering',
+    description='Retrieves a cursor-paginated list of example entities (newest first) with optional filtering',
     status_code=status.HTTP_200_OK,
-    response_model=Page[ExampleEntityOut],
+    response_model=CursorPage[ExampleEntityOut],
 )
 async def get_all_entities(
-    db_session: DatabaseDependency,
+    request: Request,
+    db_session: ReadDatabaseDependency,
+    pagination: Annotated[CursorPaginationParams, Depends()],
     name: Optional[str] = Query(
         None,
         description='Filter by name (case-insensitive partial match)',
@@ -156,43 +283,143 @@ async def get_all_entities(
         None,
         description='Filter by active status'
     ),
-) -> Page[ExampleEntityOut]:
+):
     """
     Get all example entities with optional filters
     
+    Uses keyset pagination: pass the returned next_cursor as ?cursor= to get
+    the next page. Every page costs the same regardless of depth.
+    
+    Pages are served from a short-lived in-process cache when possible
+    (LIST_CACHE_TTL), and the cache is cleared by every write.
+    
     Args:
-        db_session: Database session (injected)
+        request: Incoming request (for If-None-Match)
+        db_session: Read-only database session (injected)
+        pagination: Cursor and page size
         name: Optional name filter (partial match)
         is_active: Optional active status filter
         
     Returns:
-        Page[ExampleEntityOut]: Paginated list of entities
+        CursorPage[ExampleEntityOut]: Page of entities and the next cursor
         
     Example:
-        GET /examples?name=test&is_active=true&page=1&size=10
+        GET /examples?name=test&is_active=true&size=10
+        GET /examples?name=test&is_active=true&size=10&cursor=<next_cursor>
     """
-    # Start with base query
-    query = select(ExampleEntityModel)
+    # Serve the page from the cache if an identical request was answered recently
+    cache_key = (name, is_active, pagination.cursor, pagination.size)
+    cached = _list_cache.get(cache_key)
+    if cached is not None:
+        return _list_page_response(request, *cached)
+    
+    # Collect filters if provided, then build the query once
+    # Filter values are bound parameters, so every combination of filters
+    # compiles to one cached statement regardless of the values
+    filters = []
     
-    # Apply filters if provided
     if name:
-        query = query.filter(ExampleEntityModel.name.ilike(f'%{name}%'))
+        filters.append(ExampleEntityModel.name.ilike(f'%{name}%'))
     
     if is_active is not None:
-        query = query.filter(ExampleEntityModel.is_active == is_active)
+        filters.append(ExampleEntityModel.is_active == is_active)
     
-    # Add ordering
-    query = query.order_by(ExampleEntityModel.created_at.desc())
+    query = select(ExampleEntityModel).where(*filters)
     
-    # Execute query
+    # Apply keyset pagination (newest first) and execute
+    query = apply_keyset(query, ExampleEntityModel, pagination.cursor, pagination.size)
     result = await db_session.execute(query)
-    entities = result.scalars().all()
     
-    # Convert to output schemas and paginate
-    return paginate([
-        ExampleEntityOut.model_validate(entity)
-        for entity in entities
-    ])
+    page = cursor_page(result.scalars().all(), pagination.size)
+    
+    body = encode_msgspec_json(ExampleEntityPageFast(
+        items=[ExampleEntityOutFast.from_model(entity) for entity in page['items']],
+        next_cursor=page['next_cursor']
+    ))
+    etag = f'"{blake2b(body, digest_size=16).hexdigest()}"'
+    
+    if settings.LIST_CACHE_TTL > 0:
+        _list_cache[cache_key] = (body, etag)
+    
+    return _list_page_response(request, body, etag)
+
+
+@router.get(
+    '/export',
+    summary='Export example entities',
+    description='Streams every matching example entity as one JSON array (newest first)',
+    status_code=status.HTTP_200_OK,
+    response_model=list[ExampleEntityOut]
+)
+async def export_entities(
+    current_user: CurrentUserBasic,  # Requires HTTP Basic Authentication
+    db_session: ReadDatabaseDependency,
+    name: Optional[str] = Query(
+        None,
+        description='Filter by name (case-insensitive partial match)'
+    ),
+    is_active: Optional[bool] = Query(
+        None,
+        description='Filter by active status'
+    ),
+):
+    """
+    Export all matching example entities as a streamed JSON array
+    
+    Rows are fetched from a server-side cursor in batches of 200 and each
+    batch is encoded and sent as soon as it arrives, so the first bytes go
+    out before the query finishes and memory stays bounded no matter how
+    many rows match. Use this for exports only; regular clients should page
+    through GET / instead.
+    
+    Each export holds a read connection until the client has read the whole
+    response, so it requires authentication and stops after
+    EXPORT_MAX_ROWS rows.
+    
+    Args:
+        current_user: Current authenticated user (injected)
+        db_session: Read-only database session (injected)
+        name: Optional name filter (partial match)
+        is_active: Optional active status filter
+        
+    Returns:
+        StreamingResponse: JSON array of ExampleEntityOut
+        
+    Raises:
+        HTTPException 401: If authentication fails
+        
+    Example with curl:
+        curl -u username:password "http://localhost:8000/examples/export?is_active=true"
+    """
+    filters = []
+    
+    if name:
+        filters.append(ExampleEntityModel.name.ilike(f'%{name}%'))
+    
+    if is_active is not None:
+        filters.append(ExampleEntityModel.is_active == is_active)
+    
+    query = (
+        select(ExampleEntityModel)
+        .where(*filters)
+        .order_by(ExampleEntityModel.created_at.desc(), ExampleEntityModel.pk_id.desc())
+        .limit(settings.EXPORT_MAX_ROWS)
+        .execution_options(yield_per=200)
+    )
+    
+    async def stream_rows() -> AsyncIterator[bytes]:
+        result = await db_session.stream_scalars(query)
+        separator = b'['
+        
+        async for entities in result.partitions():
+            yield separator + b','.join(
+                encode_msgspec_json(ExampleEntityOutFast.from_model(entity)) for entity in entities
+            )
+            separator = b','
+        
+        yield b']' if separator == b',' else b'[]'
+    
+    return StreamingResponse(stream_rows(), media_type='application/json')
 
 
 @router.get(
@@ -203,7 +430,7 @@ async def get_all_entities(
     response_model=ExampleEntityOut
 )
 async def get_entity_by_id(
-    entity_id: UUID4,
+    entity_id: UUID,
     db_session: DatabaseDependency
 ):
     """
@@ -222,11 +449,9 @@ async def get_entity_by_id(
     Example:
         GET /examples/550e8400-e29b-41d4-a716-446655440000
     """
-    # Query for entity by UUID
-    result = await db_session.execute(
-        select(ExampleEntityModel).filter_by(id=entity_id)
-    )
-    entity = result.scalars().first()
+    # Query for entity by UUID (unique, indexed)
+    # scalar() fetches the single row directly instead of building a full result set
+    entity = await db_session.scalar(_SELECT_BY_ID, {'entity_id': entity_id})
     
     if not entity:
         raise HTTPException(
@@ -234,7 +459,7 @@ async def get_entity_by_id(
             detail=f'Entity with id {entity_id} not found'
         )
     
-    return ExampleEntityOut.model_validate(entity)
+    return MsgspecJSONResponse(ExampleEntityOutFast.from_model(entity))
 
 
 @router.patch(
@@ -245,9 +470,9 @@ async def get_entity_by_id(
     response_model=ExampleEntityOut
 )
 async def update_entity(
-    entity_id: UUID4,
-    db_session: DatabaseDependency,
+    entity_id: UUID,
     current_user: CurrentUserBasic,  # Requires HTTP Basic Authentication
+    db_session: DatabaseDependency,
     entity_update: ExampleEntityUpdate = Body(
         ...,
         description='Fields to update (all optional)'
@@ -274,11 +499,35 @@ async def update_entity(
             "is_active": false
         }
     """
-    # Get existing entity
-    result = await db_session.execute(
-        select(ExampleEntityModel).filter_by(id=entity_id)
-    )
-    entity = result.scalars().first()
+    # Dump the provided fields once
+    update_data = entity_update.model_dump(exclude_unset=True)
+    
+    if not update_data:
+        # Nothing to change: return the entity as it is, without writing
+        # or clearing the list cache
+        entity = await db_session.scalar(_SELECT_BY_ID, {'entity_id': entity_id})
+    else:
+        try:
+            # Single UPDATE ... RETURNING: no SELECT before, no refresh after
+            entity = await db_session.scalar(
+                _UPDATE_BY_ID.values(**update_data),
+                {'entity_id': entity_id}
+            )
+            await db_session.commit()
+            _list_cache.clear()
+            
+        except IntegrityError as e:
+            await db_session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f'Update violates constraint: {str(e)}'
+            )
+        except Exception as e:
+            await db_session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f'An error occurred while updating the entity: {str(e)}'
+            )
     
     if not entity:
         raise HTTPException(
@@ -286,31 +535,7 @@ async def update_entity(
             detail=f'Entity with id {entity_id} not found'
         )
     
-    try:
-        # Update only provided fields
-        update_data = entity_update.model_dump(exclude_unset=True)
-        
-        for field, value in update_data.items():
-            setattr(entity, field, value)
-        
-        # Commit changes
-        await db_session.commit()
-        await db_session.refresh(entity)
-        
-        return ExampleEntityOut.model_validate(entity)
-        
-    except IntegrityError as e:
-        await db_session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f'Update violates constraint: {str(e)}'
-        )
-    except Exception as e:
-        await db_session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f'An error occurred while updating the entity: {str(e)}'
-        )
+    return MsgspecJSONResponse(ExampleEntityOutFast.from_model(entity))
 
 
 @router.delete(
@@ -320,9 +545,9 @@ async def update_entity(
     status_code=status.HTTP_204_NO_CONTENT
 )
 async def delete_entity(
-    entity_id: UUID4,
-    db_session: DatabaseDependency,
-    current_user: CurrentUserBasic  # Requires HTTP Basic Authentication
+    entity_id: UUID,
+    current_user: CurrentUserBasic,  # Requires HTTP Basic Authentication
+    db_session: DatabaseDependency
 ):
     """
     Delete an example entity
@@ -341,22 +566,12 @@ async def delete_entity(
     Example:
         DELETE /examples/550e8400-e29b-41d4-a716-446655440000
     """
-    # Get existing entity
-    result = await db_session.execute(
-        select(ExampleEntityModel).filter_by(id=entity_id)
-    )
-    entity = result.scalars().first()
-    
-    if not entity:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f'Entity with id {entity_id} not found'
-        )
-    
     try:
-        # Delete entity
-        await db_session.delete(entity)
+        # Delete in a single statement, no SELECT first
+        # rowcount tells whether the entity existed
+        result = await db_session.execute(_DELETE_BY_ID, {'entity_id': entity_id})
         await db_session.commit()
+        _list_cache.clear()
         
     except Exception as e:
         await db_session.rollback()
@@ -364,6 +579,12 @@ async def delete_entity(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f'An error occurred while deleting the entity: {str(e)}'
         )
+    
+    if result.rowcount == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'Entity with id {entity_id} not found'
+        )
 
 
 # Additional endpoint examples:
@@ -380,41 +601,28 @@ async def delete_entity(
 #     return {'count': count}
 
 
-# Bulk create
-# @router.post('/bulk', response_model=list[ExampleEntityOut])
-# async def bulk_create(
-#     db_session: DatabaseDependency,
-#     entities: list[ExampleEntityIn] = Body(...)
-# ):
-#     """Create multiple entities at once"""
-#     created_entities = []
-#     for entity_in in entities:
-#         entity_out = ExampleEntityOut(
-#             id=uuid4(),
-#             created_at=datetime.utcnow(),
-#             **entity_in.model_dump()
-#         )
-#         entity_model = ExampleEntityModel(**entity_out.model_dump())
-#         db_session.add(entity_model)
-#         created_entities.append(entity_out)
-#     
-#     await db_session.commit()
-#     return created_entities
-
-
 # Search endpoint
-# @router.get('/search', response_model=Page[ExampleEntityOut])
+# Full-text search over name + description, served by the GIN index
+# ix_example_entities_search (see example_search_vector in models.py).
+# websearch_to_tsquery accepts search-engine syntax: "exact phrase", -excluded, a or b
+# @router.get('/search', response_model=CursorPage[ExampleEntityOut])
 # async def search_entities(
-#     db_session: DatabaseDependency,
+#     db_session: ReadDatabaseDependency,
+#     pagination: Annotated[CursorPaginationParams, Depends()],
 #     q: str = Query(..., description='Search query')
 # ):
 #     """Full-text search across multiple fields"""
-#     query = select(ExampleEntityModel).filter(
-#         or_(
-#             ExampleEntityModel.name.ilike(f'%{q}%'),
-#             ExampleEntityModel.description.ilike(f'%{q}%')
+#     from sqlalchemy import func, text
+#     from .models import example_search_vector
+#     query = select(ExampleEntityModel).where(
+#         example_search_vector.op('@@')(
+#             func.websearch_to_tsquery(text("'simple'::regconfig"), q)
 #         )
 #     )
+#     query = apply_keyset(query, ExampleEntityModel, pagination.cursor, pagination.size)
 #     result = await db_session.execute(query)
-#     entities = result.scalars().all()
-#     return paginate([ExampleEntityOut.model_validate(e) for e in entities])
+#     page = cursor_page(result.scalars().all(), pagination.size)
+#     return MsgspecJSONResponse(ExampleEntityPageFast(
+#         items=[ExampleEntityOutFast.from_model(entity) for entity in page['items']],
+#         next_cursor=page['next_cursor']
+#     ))
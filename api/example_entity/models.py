@@ -9,6 +9,7 @@ Instructions for creating your own models:
 3. Set the __tablename__ attribute (use plural, snake_case)
 4. Define columns using Mapped and mapped_column
 5. Add relationships if needed with foreign keys
+6. Add indexes matching the WHERE/ORDER BY of your hot queries
 
 Column types commonly used:
 - Integer: For integer numbers
@@ -29,7 +30,7 @@ After creating/modifying models:
 """
 
 from datetime import datetime
-from sqlalchemy import DateTime, Integer, String, Float, Boolean, Text
+from sqlalchemy import DateTime, Integer, String, Float, Boolean, Text, Index, func, literal_column, text
 from sqlalchemy.orm import Mapped, mapped_column
 from api.contrib.models import BaseModel
 
@@ -47,13 +48,17 @@ class ExampleEntityModel(BaseModel):
         description: Entity description (optional, text field)
         value: Numeric value (optional, float)
         is_active: Active status flag (default True)
-        created_at: Creation timestamp (auto-set)
+        created_at: Creation timestamp (set by the database)
         
     Table name: example_entities
     """
     
     __tablename__ = 'example_entities'
     
+    # Fetch server-generated values (created_at) with RETURNING on INSERT,
+    # instead of a lazy SELECT the first time they are accessed
+    __mapper_args__ = {'eager_defaults': True}
+    
     # Primary Key - Auto-incrementing integer
     pk_id: Mapped[int] = mapped_column(
         Integer,
@@ -93,9 +98,11 @@ class ExampleEntityModel(BaseModel):
     )
     
     # Timestamp field
+    # Set by the database (UTC, transaction time) and returned by the INSERT,
+    # so inserts need no client-side value
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.timezone('utc', func.now()),
         nullable=False,
         comment='Creation timestamp'
     )
@@ -125,3 +132,48 @@ class ExampleEntityModel(BaseModel):
     def __repr__(self) -> str:
         """String representation of the model"""
         return f"<ExampleEntity(id={self.pk_id}, name='{self.name}')>"
+
+
+# Indexes for the list endpoint
+# The list query filters on is_active and pages by (created_at DESC, pk_id DESC),
+# so these let PostgreSQL walk an index in order instead of Seq Scan + Sort.
+# Declared after the class so they can use column expressions like .desc()
+Index(
+    'ix_example_entities_active_created',
+    ExampleEntityModel.is_active,
+    ExampleEntityModel.created_at.desc(),
+    ExampleEntityModel.pk_id.desc(),
+)
+Index(
+    'ix_example_entities_created',
+    ExampleEntityModel.created_at.desc(),
+    ExampleEntityModel.pk_id.desc(),
+)
+
+# Trigram index for name.ilike('%term%')
+# A B-tree index cannot serve a leading-wildcard ILIKE; pg_trgm's GIN can.
+# Requires the pg_trgm extension (created in migration 004)
+Index(
+    'ix_example_entities_name_trgm',
+    ExampleEntityModel.name,
+    postgresql_using='gin',
+    postgresql_ops={'name': 'gin_trgm_ops'},
+)
+
+# Full-text search document over name + description
+# Queries must use this exact expression to hit ix_example_entities_search:
+#   .where(example_search_vector.op('@@')(func.websearch_to_tsquery(text("'simple'::regconfig"), q)))
+# Literals are rendered inline (not as bound parameters) so the planner can
+# match the query expression to the index expression.
+example_search_vector = func.to_tsvector(
+    text("'simple'::regconfig"),
+    ExampleEntityModel.name
+    .concat(literal_column("' '"))
+    .concat(func.coalesce(ExampleEntityModel.description, literal_column("''"))),
+)
+
+Index(
+    'ix_example_entities_search',
+    example_search_vector,
+    postgresql_using='gin',
+)
@@ -28,7 +28,7 @@ Common types:
 - float: Float
 - bool: Boolean
 - datetime: DateTime
-- UUID4: UUID
+- UUID: UUID (from uuid import UUID)
 - Optional[type]: Optional field (can be None)
 - list[type]: List of items
 """
@@ -0,0 +1,73 @@
+"""
+Example Entity msgspec Schemas
+
+Response-only counterparts of the Pydantic schemas in schemas.py, built on
+msgspec.Struct for the hot CRUD paths.
+
+Responses are built from rows loaded from the database, which are already
+valid, so they don't need Pydantic's validation. msgspec Structs are cheap
+to create and msgspec's JSON encoder serializes them in a single C pass,
+noticeably faster than Pydantic + orjson, especially on list responses
+with many items.
+
+Instructions:
+1. Keep Pydantic schemas (schemas.py) for request bodies, they need validation
+2. Mirror the fields of your Out schema in a Struct (required fields first)
+3. Build Structs from ORM models with a small from_model() helper
+4. Keep response_model=<Pydantic Out schema> on the route for the OpenAPI docs
+5. Return MsgspecJSONResponse(struct) (api.contrib.responses)
+
+Example:
+    entity = await db_session.get(ExampleEntityModel, pk_id)
+    return MsgspecJSONResponse(ExampleEntityOutFast.from_model(entity))
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+import msgspec
+
+
+class ExampleEntityOutFast(msgspec.Struct, frozen=True):
+    """
+    msgspec variant of ExampleEntityOut
+    
+    Serializes to the same JSON as ExampleEntityOut.
+    """
+    
+    id: UUID
+    created_at: datetime
+    name: str
+    description: Optional[str] = None
+    value: Optional[float] = None
+    is_active: bool = True
+    
+    @classmethod
+    def from_model(cls, entity: Any) -> 'ExampleEntityOutFast':
+        """
+        Build a Struct from an ExampleEntityModel (no validation)
+        
+        Args:
+            entity: ExampleEntityModel instance or any object with the same attributes
+            
+        Returns:
+            ExampleEntityOutFast: Struct ready for MsgspecJSONResponse
+        """
+        return cls(
+            id=entity.id,
+            created_at=entity.created_at,
+            name=entity.name,
+            description=entity.description,
+            value=entity.value,
+            is_active=entity.is_active,
+        )
+
+
+class ExampleEntityPageFast(msgspec.Struct, frozen=True):
+    """
+    msgspec variant of CursorPage[ExampleEntityOut]
+    """
+    
+    items: list[ExampleEntityOutFast]
+    next_cursor: Optional[str] = None
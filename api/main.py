@@ -5,10 +5,38 @@ This file initializes the FastAPI application and includes all routers.
 Customize the title, description, and version according to your project.
 """
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from api.routers import api_router
+from api.configs.database import dispose_engines, warm_up_pools
 from fastapi_pagination import add_pagination
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan - startup and shutdown
+    
+    Code before yield runs once on startup (e.g. database connections, cache
+    warmup), code after yield runs once on shutdown (cleanup).
+    
+    Startup opens DB_POOL_WARMUP connections per pool, so the first requests
+    reuse open connections instead of connecting on demand (a failed warm-up
+    is logged and doesn't stop startup). Shutdown closes all pooled
+    connections.
+    """
+    await warm_up_pools()
+    print("🚀 FastAPI Template started successfully!")
+    
+    yield
+    
+    print("👋 FastAPI Template shutting down...")
+    await dispose_engines()
+
+
 # Create FastAPI application instance
 # Customize these parameters for your project
 app = FastAPI(
@@ -17,6 +45,8 @@ app = FastAPI(
     version='0.1.0',
     docs_url='/docs',  # Swagger UI
     redoc_url='/redoc',  # ReDoc
+    default_response_class=ORJSONResponse,  # Serialize responses with orjson (C) instead of json
+    lifespan=lifespan,  # Startup/shutdown logic
 )
 
 # Include all API routers
@@ -51,21 +81,3 @@ async def health_check():
     """
     return {'status': 'healthy'}
 
-
-# Optional: Add startup and shutdown events
-@app.on_event("startup")
-async def startup_event():
-    """
-    Execute on application startup
-    Add any initialization code here (e.g., database connections, cache warmup)
-    """
-    print("🚀 FastAPI Template started successfully!")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Execute on application shutdown
-    Add cleanup code here (e.g., close database connections, save state)
-    """
-    print("👋 FastAPI Template shutting down...")
@@ -2,22 +2,72 @@
 Authentication Utilities
 
 Provides password hashing, JWT token generation/validation, and user authentication.
+
+Passwords are hashed with Argon2id. Older bcrypt hashes are still accepted
+and are replaced with an Argon2id hash the next time the user logs in.
+
+Password hashing is deliberately CPU-expensive (milliseconds per call), so
+hash_password() and verify_password() run it in worker threads and must be
+awaited. Running it directly in an async route would block the event loop
+and stall every other request on the worker.
+
+At most PASSWORD_HASH_WORKERS hashes run at once (one per CPU by default):
+more threads would not hash any faster, only contend for the same cores and
+take threadpool slots away from other blocking calls.
 """
 
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
+import os
+from anyio import CapacityLimiter
+from anyio.to_thread import run_sync
 from passlib.context import CryptContext
-from jose import JWTError, jwt
+from sqlalchemy import bindparam, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+import jwt
 from api.configs.settings import settings
+from api.users.models import UserModel
+
+
+# Password hashing context using Argon2id
+# Costs come from settings (defaults: OWASP's 19 MiB / 2 iterations / 1 lane).
+# bcrypt is kept only to verify hashes created before the switch; "deprecated"
+# marks them (and Argon2 hashes with outdated costs) as needing a rehash.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated=["bcrypt"],
+    argon2__type="ID",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM
+)
 
+# Bounds concurrent hashing threads (separate from FastAPI's shared threadpool)
+_hash_limiter = CapacityLimiter(settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1)
 
-# Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# JWT signing parameters, resolved once instead of on every encode/decode
+_JWT_SECRET_KEY = settings.SECRET_KEY
+_JWT_ALGORITHM = settings.ALGORITHM
+_JWT_ALGORITHMS = [settings.ALGORITHM]
+_JWT_DECODE_OPTIONS = {"require": ["exp"]}
 
+# Login lookup by username or email, built once and reused with a bound value
+# Written as UNION ALL of two point queries instead of "username = :x OR
+# email = :x", so each branch is a seek on its own unique index rather than
+# a bitmap OR (or sequential scan) across both columns
+_USER_BY_LOGIN = select(UserModel).from_statement(
+    union_all(
+        select(UserModel).where(UserModel.username == bindparam('login')),
+        select(UserModel).where(UserModel.email == bindparam('login')),
+    ).limit(1)
+)
 
-def hash_password(password: str) -> str:
+
+async def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt
+    Hash a password using Argon2id (in a hashing thread)
     
     Args:
         password: Plain text password
@@ -26,26 +76,137 @@ def hash_password(password: str) -> str:
         str: Hashed password
         
     Example:
-        hashed = hash_password("MyPassword123")
+        hashed = await hash_password("MyPassword123")
     """
-    return pwd_context.hash(password)
+    return await run_sync(pwd_context.hash, password, limiter=_hash_limiter)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: Optional[str]) -> bool:
     """
-    Verify a password against its hash
+    Verify a password against its hash (in a hashing thread)
+    
+    Pass None when no user was found: a dummy hash is verified instead, so
+    an unknown username takes as long as a wrong password and response
+    times don't reveal which usernames exist.
     
     Args:
         plain_password: Plain text password to verify
-        hashed_password: Hashed password from database
+        hashed_password: Hashed password from database, or None if no user
         
     Returns:
         bool: True if password matches, False otherwise
         
     Example:
-        is_valid = verify_password("MyPassword123", user.hashed_password)
+        is_valid = await verify_password("MyPassword123", user.hashed_password if user else None)
+    """
+    if hashed_password is None:
+        return await run_sync(pwd_context.dummy_verify, limiter=_hash_limiter)
+    
+    return await run_sync(pwd_context.verify, plain_password, hashed_password, limiter=_hash_limiter)
+
+
+async def verify_and_update_password(
+    plain_password: str,
+    hashed_password: Optional[str]
+) -> tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its hash is outdated (in a hashing thread)
+    
+    Use at login to upgrade legacy bcrypt hashes (or Argon2 hashes with old
+    cost settings) to the current parameters without a separate reset.
+    Like verify_password(), pass None when no user was found.
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password from database, or None if no user
+        
+    Returns:
+        tuple: (is_valid, new_hash) - new_hash is None unless the password
+            is valid and the stored hash should be replaced with it
+        
+    Example:
+        is_valid, new_hash = await verify_and_update_password(password, user.hashed_password)
+        if new_hash:
+            user.hashed_password = new_hash
+    """
+    if hashed_password is None:
+        return await run_sync(pwd_context.dummy_verify, limiter=_hash_limiter), None
+    
+    return await run_sync(
+        pwd_context.verify_and_update,
+        plain_password,
+        hashed_password,
+        limiter=_hash_limiter
+    )
+
+
+async def get_user_by_login(db_session: AsyncSession, login: str) -> Optional[UserModel]:
+    """
+    Find the user a login identifier belongs to
+    
+    Args:
+        db_session: Database session
+        login: Username or email entered by the user
+        
+    Returns:
+        UserModel: Matching user, or None if no user has that username or email
+        
+    Example:
+        user = await get_user_by_login(db_session, credentials.username)
+    """
+    result = await db_session.execute(_USER_BY_LOGIN, {'login': login})
+    return result.scalars().first()
+
+
+async def authenticate_user(
+    db_session: AsyncSession,
+    login: str,
+    password: str,
+    rehash: bool = False
+) -> Optional[UserModel]:
+    """
+    Check a username/email and password pair
+    
+    Shared by the login endpoint and HTTP Basic auth. An unknown user still
+    costs one (dummy) hash verification, so timing doesn't reveal whether
+    the username exists.
+    
+    With rehash=True (the login endpoint), outdated hashes (bcrypt, or
+    Argon2 with old costs) are replaced with a fresh Argon2id hash and
+    committed. HTTP Basic auth leaves it off: its session is shared with
+    the route, which must not see a commit it didn't make.
+    
+    Does not check is_active - callers decide how to report inactive users.
+    
+    Args:
+        db_session: Database session
+        login: Username or email entered by the user
+        password: Plain text password entered by the user
+        rehash: Upgrade and commit an outdated password hash
+        
+    Returns:
+        UserModel: Authenticated user, or None if the credentials are invalid
+        
+    Example:
+        user = await authenticate_user(db_session, credentials.username, credentials.password)
+        if user is None:
+            raise HTTPException(status_code=401, detail='Incorrect username or password')
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    user = await get_user_by_login(db_session, login)
+    hashed_password = user.hashed_password if user else None
+    
+    if rehash:
+        is_valid, new_hash = await verify_and_update_password(password, hashed_password)
+    else:
+        is_valid, new_hash = await verify_password(password, hashed_password), None
+    if not user or not is_valid:
+        return None
+    
+    if new_hash:
+        user.hashed_password = new_hash
+        await db_session.commit()
+    
+    return user
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -65,20 +226,47 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     to_encode = data.copy()
     
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
         # Default expiration: 30 days
-        expire = datetime.utcnow() + timedelta(days=30)
+        expire = datetime.now(timezone.utc) + timedelta(days=30)
     
-    to_encode.update({"exp": expire})
+    # exp as an integer UNIX timestamp (the encoder would convert a datetime)
+    to_encode.update({"exp": int(expire.timestamp())})
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
+        _JWT_SECRET_KEY,
+        algorithm=_JWT_ALGORITHM
     )
     return encoded_jwt
 
 
+@lru_cache(maxsize=4096)
+def _decode_token_claims(token: str) -> tuple[Optional[str], float]:
+    """
+    Verify a JWT token and extract its subject and expiration
+    
+    Results are cached per token, so repeated requests with the same token
+    skip the signature verification. Expiration is returned rather than
+    checked here, since a cached result must still be rejected once the
+    token expires.
+    
+    Returns:
+        tuple: (username or None if invalid, expiration as a UNIX timestamp)
+    """
+    try:
+        payload = jwt.decode(
+            token,
+            _JWT_SECRET_KEY,
+            algorithms=_JWT_ALGORITHMS,
+            options=_JWT_DECODE_OPTIONS
+        )
+    except jwt.InvalidTokenError:
+        return None, 0.0
+    
+    return payload.get("sub"), float(payload["exp"])
+
+
 def decode_access_token(token: str) -> Optional[str]:
     """
     Decode and validate a JWT token
@@ -92,13 +280,10 @@ def decode_access_token(token: str) -> Optional[str]:
     Example:
         username = decode_access_token(token)
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
-        username: str = payload.get("sub")
-        return username
-    except JWTError:
+    username, expires_at = _decode_token_claims(token)
+    
+    # Cached decodes must still be rejected once the token expires
+    if username is None or expires_at <= time.time():
         return None
+    
+    return username
@@ -9,11 +9,10 @@ from typing import Optional
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 
 from api.configs.database import get_session
 from api.users.models import UserModel
-from api.users.auth import verify_password
+from api.users.auth import authenticate_user
 
 
 # HTTP Basic security scheme
@@ -45,17 +44,8 @@ async def get_current_user_basic(
     Example request:
         curl -u username:password http://localhost:8000/api/endpoint
     """
-    # Find user by username or email
-    result = await db_session.execute(
-        select(UserModel).filter(
-            (UserModel.username == credentials.username) |
-            (UserModel.email == credentials.username)
-        )
-    )
-    user = result.scalars().first()
-    
-    # Verify user exists and password is correct
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    user = await authenticate_user(db_session, credentials.username, credentials.password)
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail='Incorrect username or password',
@@ -4,17 +4,24 @@ User Authentication Controller
 Provides endpoints for user registration, login, and management.
 """
 
-from datetime import datetime, timedelta
-from uuid import uuid4
-from typing import Optional
+from datetime import timedelta
+from uuid import UUID
+from typing import Optional, Sequence
 
 from fastapi import APIRouter, Body, HTTPException, Query, status
-from pydantic import UUID4
+from sqlalchemy import Row, bindparam, delete, func, update
 from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
-from fastapi_pagination import Page, paginate
+from fastapi_pagination import Page, resolve_params
 
-from api.contrib.dependencies import DatabaseDependency, CurrentUser, RequireAdmin
+from api.contrib.dependencies import (
+    DatabaseDependency,
+    ReadDatabaseDependency,
+    CurrentUser,
+    RequireAdmin,
+    invalidate_cached_user
+)
+from api.contrib.responses import PydanticJSONResponse
 from api.configs.settings import settings
 from .schemas import (
     UserCreate,
@@ -24,12 +31,70 @@ from .schemas import (
     Token
 )
 from .models import UserModel
-from .auth import hash_password, verify_password, create_access_token
+from .auth import hash_password, authenticate_user, create_access_token
 
 
 router = APIRouter()
 
 
+# Columns selected for user lists - exactly the UserOut fields, so list
+# queries never load hashed_password or build tracked UserModel instances
+_USER_OUT_COLUMNS = tuple(getattr(UserModel, name) for name in UserOut.model_fields)
+
+
+# Total number of matching rows, attached to every row of a page
+_TOTAL_OVER = func.count().over().label('total')
+
+
+def _build_users_out(rows: Sequence[Row]) -> list[UserOut]:
+    """
+    Convert one page of UserOut column rows to UserOut
+    
+    Rows come straight from the database, so they are not validated again.
+    """
+    return [UserOut.from_trusted(row) for row in rows]
+
+
+# Profile update for the current user, built once with a bound user id
+# The SET clause is added per request with .values(...)
+_UPDATE_USER_BY_ID = (
+    update(UserModel)
+    .where(UserModel.id == bindparam('user_id'))
+    .returning(*_USER_OUT_COLUMNS)
+    .execution_options(synchronize_session=False)
+)
+
+# Admin user deletion, built once and reused with a bound user id
+_DELETE_USER_BY_ID = (
+    delete(UserModel)
+    .where(UserModel.id == bindparam('user_id'))
+    .returning(UserModel.username)
+    .execution_options(synchronize_session=False)
+)
+
+# 409 messages keyed by the unique index that rejected a new user
+_DUPLICATE_USER_DETAILS = {
+    'ix_users_username': 'Username already exists',
+    'ix_users_email': 'Email already registered',
+}
+
+
+def _violated_constraint(error: IntegrityError) -> Optional[str]:
+    """
+    Get the name of the constraint behind an IntegrityError
+
+    asyncpg attaches constraint_name to the original driver exception,
+    which SQLAlchemy's DBAPI adapter keeps as the cause of error.orig.
+
+    Args:
+        error: IntegrityError raised by the database
+
+    Returns:
+        str: Constraint (or unique index) name, or None if not reported
+    """
+    return getattr(error.orig.__cause__, 'constraint_name', None)
+
+
 @router.post(
     '/register',
     summary='Register a new user',
@@ -57,6 +122,11 @@ async def register(
     Raises:
         HTTPException 409: If username or email already exists
         HTTPException 500: If database error occurs
+    
+    Uniqueness is enforced by the unique indexes on username and email:
+    the INSERT is attempted directly and a violation is mapped to a 409,
+    so a successful signup takes one round-trip instead of two SELECTs
+    followed by the INSERT.
         
     Example request:
         POST /auth/register
@@ -67,51 +137,32 @@ async def register(
         }
     """
     try:
-        # Check if username already exists
-        result = await db_session.execute(
-            select(UserModel).filter_by(username=user_in.username)
-        )
-        if result.scalars().first():
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail='Username already exists'
-            )
-        
-        # Check if email already exists
-        result = await db_session.execute(
-            select(UserModel).filter_by(email=user_in.email)
-        )
-        if result.scalars().first():
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail='Email already registered'
-            )
-        
         # Create user with hashed password
+        # id comes from BaseModel's uuid7 default, pk_id and created_at from the INSERT
         user_model = UserModel(
-            id=uuid4(),
             username=user_in.username,
             email=user_in.email,
-            hashed_password=hash_password(user_in.password),
+            hashed_password=await hash_password(user_in.password),
             is_active=True,
-            is_superuser=False,
-            created_at=datetime.utcnow()
+            is_superuser=False
         )
         
         db_session.add(user_model)
         await db_session.commit()
-        await db_session.refresh(user_model)
         
-        return UserOut.model_validate(user_model)
+        # No refresh needed: created_at was returned by the INSERT and the
+        # session doesn't expire objects on commit
+        return PydanticJSONResponse(UserOut.from_trusted(user_model), status_code=status.HTTP_201_CREATED)
         
-    except IntegrityError:
+    except IntegrityError as e:
         await db_session.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail='Username or email already exists'
+            detail=_DUPLICATE_USER_DETAILS.get(
+                _violated_constraint(e),
+                'Username or email already exists'
+            )
         )
-    except HTTPException:
-        raise
     except Exception as e:
         await db_session.rollback()
         raise HTTPException(
@@ -160,17 +211,13 @@ async def login(
             "token_type": "bearer"
         }
     """
-    # Find user by username or email
-    result = await db_session.execute(
-        select(UserModel).filter(
-            (UserModel.username == credentials.username) |
-            (UserModel.email == credentials.username)
-        )
+    user = await authenticate_user(
+        db_session,
+        credentials.username,
+        credentials.password,
+        rehash=True
     )
-    user = result.scalars().first()
-    
-    # Validate user exists and password is correct
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail='Incorrect username or password',
@@ -191,7 +238,7 @@ async def login(
         expires_delta=access_token_expires
     )
     
-    return Token(access_token=access_token, token_type='bearer')
+    return PydanticJSONResponse(Token(access_token=access_token, token_type='bearer'))
 
 
 @router.get(
@@ -205,6 +252,9 @@ async def get_current_user_info(current_user: CurrentUser):
     """
     Get current authenticated user information
     
+    Served from the authenticated-user cache (AuthUser carries every UserOut
+    field), so repeated calls don't query the database.
+    
     Args:
         current_user: Current user (from JWT token)
         
@@ -215,7 +265,7 @@ async def get_current_user_info(current_user: CurrentUser):
         GET /auth/me
         Authorization: Bearer <your_jwt_token>
     """
-    return UserOut.model_validate(current_user)
+    return PydanticJSONResponse(UserOut.from_trusted(current_user))
 
 
 @router.patch(
@@ -226,8 +276,8 @@ async def get_current_user_info(current_user: CurrentUser):
     response_model=UserOut
 )
 async def update_current_user(
-    db_session: DatabaseDependency,
     current_user: CurrentUser,
+    db_session: DatabaseDependency,
     user_update: UserUpdate = Body(
         ...,
         description='Fields to update'
@@ -237,8 +287,8 @@ async def update_current_user(
     Update current user information
     
     Args:
-        db_session: Database session (injected)
         current_user: Current user (from JWT token)
+        db_session: Database session (injected)
         user_update: Fields to update
         
     Returns:
@@ -252,21 +302,24 @@ async def update_current_user(
             "password": "NewSecurePass123!"
         }
     """
+    update_data = user_update.model_dump(exclude_unset=True)
+    
+    # Nothing to change: the cached user already holds every UserOut field
+    if not update_data:
+        return PydanticJSONResponse(UserOut.from_trusted(current_user))
+    
     try:
-        update_data = user_update.model_dump(exclude_unset=True)
-        
         # Hash password if updating
         if 'password' in update_data:
-            update_data['hashed_password'] = hash_password(update_data.pop('password'))
-        
-        # Update fields
-        for field, value in update_data.items():
-            setattr(current_user, field, value)
+            update_data['hashed_password'] = await hash_password(update_data.pop('password'))
         
+        # Single UPDATE ... RETURNING: no SELECT before, no refresh after
+        result = await db_session.execute(
+            _UPDATE_USER_BY_ID.values(**update_data),
+            {'user_id': current_user.id}
+        )
+        row = result.one_or_none()
         await db_session.commit()
-        await db_session.refresh(current_user)
-        
-        return UserOut.model_validate(current_user)
         
     except IntegrityError:
         await db_session.rollback()
@@ -280,6 +333,17 @@ async def update_current_user(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f'An error occurred while updating user: {str(e)}'
         )
+    
+    invalidate_cached_user(current_user.username)
+    
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail='User not found',
+            headers={'WWW-Authenticate': 'Bearer'}
+        )
+    
+    return PydanticJSONResponse(UserOut.from_trusted(row))
 
 
 @router.get(
@@ -290,8 +354,8 @@ async def update_current_user(
     response_model=Page[UserOut]
 )
 async def list_users(
-    db_session: DatabaseDependency,
     admin: RequireAdmin,
+    db_session: ReadDatabaseDependency,
     username: Optional[str] = Query(None, description='Filter by username'),
     email: Optional[str] = Query(None, description='Filter by email'),
     is_active: Optional[bool] = Query(None, description='Filter by active status')
@@ -300,8 +364,8 @@ async def list_users(
     List all users (Admin only)
     
     Args:
-        db_session: Database session (injected)
         admin: Current admin user (validated)
+        db_session: Read-only database session (injected)
         username: Optional username filter
         email: Optional email filter
         is_active: Optional active status filter
@@ -313,23 +377,42 @@ async def list_users(
         GET /auth/users?is_active=true&page=1&size=10
         Authorization: Bearer <admin_jwt_token>
     """
-    query = select(UserModel)
+    filters = []
     
     if username:
-        query = query.filter(UserModel.username.ilike(f'%{username}%'))
+        filters.append(UserModel.username.ilike(f'%{username}%'))
     
     if email:
-        query = query.filter(UserModel.email.ilike(f'%{email}%'))
+        filters.append(UserModel.email.ilike(f'%{email}%'))
     
     if is_active is not None:
-        query = query.filter(UserModel.is_active == is_active)
+        filters.append(UserModel.is_active == is_active)
     
-    query = query.order_by(UserModel.created_at.desc())
+    params = resolve_params()
+    raw_params = params.to_raw_params()
     
-    result = await db_session.execute(query)
-    users = result.scalars().all()
+    # One statement for the page and the total: count(*) OVER () is computed
+    # over all matching rows before LIMIT/OFFSET, so every row carries it
+    result = await db_session.execute(
+        select(*_USER_OUT_COLUMNS, _TOTAL_OVER)
+        .where(*filters)
+        .order_by(UserModel.created_at.desc())
+        .limit(raw_params.limit)
+        .offset(raw_params.offset)
+    )
+    rows = result.all()
+    
+    if rows:
+        total = rows[0].total
+    elif raw_params.offset:
+        # Page past the end: no row to read the total from, count separately
+        total = await db_session.scalar(
+            select(func.count()).select_from(UserModel).where(*filters)
+        )
+    else:
+        total = 0
     
-    return paginate([UserOut.model_validate(user) for user in users])
+    return PydanticJSONResponse(Page.create(_build_users_out(rows), params, total=total))
 
 
 @router.delete(
@@ -339,17 +422,17 @@ async def list_users(
     status_code=status.HTTP_204_NO_CONTENT
 )
 async def delete_user(
-    user_id: UUID4,
-    db_session: DatabaseDependency,
-    admin: RequireAdmin
+    user_id: UUID,
+    admin: RequireAdmin,
+    db_session: DatabaseDependency
 ):
     """
     Delete a user (Admin only)
     
     Args:
         user_id: UUID of user to delete
-        db_session: Database session (injected)
         admin: Current admin user (validated)
+        db_session: Database session (injected)
         
     Raises:
         HTTPException 404: If user not found
@@ -366,16 +449,19 @@ async def delete_user(
             detail='Cannot delete your own account'
         )
     
+    # Single DELETE ... RETURNING: no SELECT and no ORM instance needed,
+    # the returned username is all the auth cache needs
     result = await db_session.execute(
-        select(UserModel).filter_by(id=user_id)
+        _DELETE_USER_BY_ID,
+        {'user_id': user_id}
     )
-    user = result.scalars().first()
+    username = result.scalar_one_or_none()
     
-    if not user:
+    if username is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail='User not found'
         )
     
-    await db_session.delete(user)
     await db_session.commit()
+    invalidate_cached_user(username)
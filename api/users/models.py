@@ -5,7 +5,7 @@ This file defines the database schema for users and authentication.
 """
 
 from datetime import datetime
-from sqlalchemy import DateTime, Integer, String, Boolean
+from sqlalchemy import DateTime, Integer, String, Boolean, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 from api.contrib.models import BaseModel
 
@@ -20,14 +20,19 @@ class UserModel(BaseModel):
         pk_id: Primary key
         username: Unique username
         email: User email address
-        hashed_password: Bcrypt hashed password
+        hashed_password: Argon2id password hash (bcrypt for legacy hashes not yet
+            upgraded at login)
         is_active: Whether user account is active
         is_superuser: Whether user has admin privileges
-        created_at: Account creation timestamp
+        created_at: Account creation timestamp (set by the database)
     """
     
     __tablename__ = 'users'
     
+    # Fetch server-generated values (created_at) with RETURNING on INSERT,
+    # instead of a lazy SELECT the first time they are accessed
+    __mapper_args__ = {'eager_defaults': True}
+    
     pk_id: Mapped[int] = mapped_column(
         Integer,
         primary_key=True,
@@ -35,6 +40,7 @@ class UserModel(BaseModel):
         comment='Primary key'
     )
     
+    # Unique index - looked up on every authenticated request
     username: Mapped[str] = mapped_column(
         String(50),
         unique=True,
@@ -71,12 +77,34 @@ class UserModel(BaseModel):
         comment='Admin privileges'
     )
     
+    # Set by the database (UTC, transaction time) and returned by the INSERT
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.timezone('utc', func.now()),
         nullable=False,
         comment='Account creation timestamp'
     )
     
+    # Relationships example - use lazy='selectin' so related rows are loaded
+    # with one SELECT ... IN query instead of a lazy load per access:
+    # roles: Mapped[list['RoleModel']] = relationship(back_populates='user', lazy='selectin')
+    
     def __repr__(self) -> str:
         return f"<User(id={self.pk_id}, username='{self.username}', email='{self.email}')>"
+
+
+# Trigram indexes for the admin user search (username/email.ilike('%term%'))
+# A B-tree index cannot serve a leading-wildcard ILIKE; pg_trgm's GIN can.
+# Requires the pg_trgm extension (created in migration 004)
+Index(
+    'ix_users_username_trgm',
+    UserModel.username,
+    postgresql_using='gin',
+    postgresql_ops={'username': 'gin_trgm_ops'},
+)
+Index(
+    'ix_users_email_trgm',
+    UserModel.email,
+    postgresql_using='gin',
+    postgresql_ops={'email': 'gin_trgm_ops'},
+)
@@ -4,11 +4,17 @@ User Pydantic Schemas
 Defines validation schemas for user-related operations.
 """
 
+import re
 from typing import Annotated, Optional
 from pydantic import Field, EmailStr, field_validator
 from api.contrib.schemas import BaseSchema, OutMixin
 
 
+# Usernames: letters and digits (Unicode, as with str.isalnum()), _, - and .
+# with at least one letter or digit, so names like '...' or '___' are rejected
+_USERNAME_RE = re.compile(r'(?=.*[^\W_])[\w.-]+')
+
+
 class UserBase(BaseSchema):
     """Base user schema with common fields"""
     
@@ -34,7 +40,7 @@ class UserBase(BaseSchema):
     @classmethod
     def username_alphanumeric(cls, v: str) -> str:
         """Validate username is alphanumeric"""
-        if not v.replace('_', '').replace('-', '').replace('.', '').isalnum():
+        if not _USERNAME_RE.fullmatch(v):
             raise ValueError('Username must be alphanumeric (can include _ and -)')
         return v.lower()
 
@@ -56,11 +62,25 @@ class UserCreate(UserBase):
     @classmethod
     def password_strength(cls, v: str) -> str:
         """Validate password strength"""
-        if not any(c.isupper() for c in v):
+        # One pass over the password, stopping once every class has been seen
+        has_upper = has_lower = has_digit = False
+        for c in v:
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            else:
+                continue
+            if has_upper and has_lower and has_digit:
+                break
+        
+        if not has_upper:
             raise ValueError('Password must contain at least one uppercase letter')
-        if not any(c.islower() for c in v):
+        if not has_lower:
             raise ValueError('Password must contain at least one lowercase letter')
-        if not any(c.isdigit() for c in v):
+        if not has_digit:
             raise ValueError('Password must contain at least one digit')
         return v
 
@@ -85,9 +105,20 @@ class UserLogin(BaseSchema):
     ]
 
 
-class UserOut(UserBase, OutMixin):
+# Not derived from UserBase: values come from the database and were validated
+# on the way in, so username and email are plain str instead of re-running
+# the username validator and email-validator on every response
+class UserOut(OutMixin):
     """Schema for user responses (excludes password)"""
     
+    username: Annotated[str, Field(description='Username', json_schema_extra={'example': 'johndoe'})]
+    email: Annotated[
+        str,
+        Field(
+            description='Email address',
+            json_schema_extra={'format': 'email', 'example': 'john@example.com'}
+        )
+    ]
     is_active: Annotated[bool, Field(description='Account active status')]
     is_superuser: Annotated[bool, Field(description='Admin privileges')]
 
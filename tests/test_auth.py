@@ -0,0 +1,103 @@
+"""
+Tests for JWT decoding and the authenticated user cache
+"""
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from api.contrib.dependencies import AuthUser, _user_cache
+from api.users import auth
+from api.users.controller import delete_user, update_current_user
+from api.users.schemas import UserUpdate
+
+
+class _FakeSession:
+    """Session stand-in returning one canned row for UPDATE/DELETE ... RETURNING"""
+
+    def __init__(self, row):
+        self.row = row
+        self.committed = False
+
+    async def execute(self, statement, params=None):
+        return self
+
+    def one_or_none(self):
+        return self.row
+
+    def scalar_one_or_none(self):
+        return self.row
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        pass
+
+
+def _auth_user(username: str, is_superuser: bool = False) -> AuthUser:
+    return AuthUser(
+        id=uuid4(),
+        username=username,
+        email=f'{username}@example.com',
+        is_active=True,
+        is_superuser=is_superuser,
+        created_at=datetime(2026, 10, 15),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    _user_cache.clear()
+    auth._decode_token_claims.cache_clear()
+    yield
+    _user_cache.clear()
+    auth._decode_token_claims.cache_clear()
+
+
+def test_decode_access_token_returns_subject():
+    token = auth.create_access_token({'sub': 'johndoe'}, timedelta(minutes=5))
+
+    assert auth.decode_access_token(token) == 'johndoe'
+
+
+def test_decode_access_token_rejects_expired_cached_token(monkeypatch):
+    token = auth.create_access_token({'sub': 'johndoe'}, timedelta(minutes=5))
+    assert auth.decode_access_token(token) == 'johndoe'
+
+    expired_at = auth.time.time() + 10 * 60
+    monkeypatch.setattr(auth.time, 'time', lambda: expired_at)
+
+    assert auth.decode_access_token(token) is None
+    assert auth._decode_token_claims.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_update_current_user_evicts_cached_user():
+    user = _auth_user('johndoe')
+    _user_cache[user.username] = user
+    db_session = _FakeSession(replace(user, email='new@example.com'))
+
+    await update_current_user(
+        current_user=user,
+        db_session=db_session,
+        user_update=UserUpdate(email='new@example.com'),
+    )
+
+    assert db_session.committed
+    assert user.username not in _user_cache
+
+
+@pytest.mark.asyncio
+async def test_delete_user_evicts_cached_user():
+    admin = _auth_user('admin', is_superuser=True)
+    user = _auth_user('johndoe')
+    _user_cache[user.username] = user
+    db_session = _FakeSession(user.username)
+
+    await delete_user(user_id=user.id, admin=admin, db_session=db_session)
+
+    assert db_session.committed
+    assert user.username not in _user_cache
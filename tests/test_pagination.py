@@ -0,0 +1,55 @@
+"""
+Tests for the keyset pagination cursors
+"""
+
+from base64 import urlsafe_b64encode
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from api.contrib.pagination import decode_cursor, encode_cursor
+
+
+def _raw_cursor(value: str) -> str:
+    return urlsafe_b64encode(value.encode()).decode()
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 10, 15, 10, 24, 15, 37000)
+
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+@pytest.mark.parametrize('cursor', [
+    'zzz',
+    _raw_cursor('2026-10-15T10:24:15'),
+    _raw_cursor('not a date|42'),
+    _raw_cursor('2026-10-15T10:24:15|forty-two'),
+    _raw_cursor('2026-10-15T10:24:15|42|1'),
+])
+def test_tampered_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_tz_aware_cursor_is_rejected():
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(_raw_cursor('2026-10-15T10:24:15+02:00|42'))
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize('cursor', [
+    _raw_cursor(f'2026-10-15T10:24:15|{2**31}'),
+    _raw_cursor('2026-10-15T10:24:15|-1'),
+    _raw_cursor('2026-10-15T10:24:15|' + '9' * 100),
+    encode_cursor(datetime(2026, 10, 15), 42) + 'A' * 100,
+])
+def test_oversized_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,23 @@
+"""
+Tests for the user request schemas
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from api.users.schemas import UserCreate
+
+
+def _user(username: str) -> UserCreate:
+    return UserCreate(username=username, email='john@example.com', password='SecurePass123')
+
+
+@pytest.mark.parametrize('username', ['johndoe', 'John.Doe', 'john_doe-1', 'jöhn', '_a_'])
+def test_username_accepts_letters_digits_and_separators(username):
+    assert _user(username).username == username.lower()
+
+
+@pytest.mark.parametrize('username', ['...', '___', '-_-', 'john doe', 'john!'])
+def test_username_rejects_invalid_names(username):
+    with pytest.raises(ValidationError):
+        _user(username)